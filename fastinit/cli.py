@@ -1,29 +1,95 @@
 """Main CLI application using Typer."""
 
+from importlib import import_module
+from typing import Any, Dict, List, Optional, Tuple
+
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich import print as rprint
+from typer.core import TyperCommand, TyperGroup
+
+# Subcommands registered by import path as (target, help). Their modules are
+# only imported when the subcommand is actually executed, so `version`, `--help`
+# and shell completion never load Jinja2, the generators or rich widgets.
+LAZY_COMMANDS: Dict[str, Tuple[str, str]] = {
+    "init": ("fastinit.commands.init:main", "Initialize a new FastAPI project"),
+    "new": (
+        "fastinit.commands.new:app",
+        "Generate new components (models, services, routes)",
+    ),
+    "sync": (
+        "fastinit.commands.sync:main",
+        "Update a generated project to the current templates",
+    ),
+}
+
+
+class LazyCommand(TyperCommand):
+    """Placeholder for a lazy subcommand, used when only its help is needed."""
+
+    def __init__(self, name: str, help: str):
+        super().__init__(name=name, help=help, short_help=help)
+
+
+class LazyGroup(TyperGroup):
+    """Typer group that imports registered subcommands on first dispatch."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._loaded: Dict[str, Any] = {}
+
+    def list_commands(self, ctx: typer.Context) -> List[str]:
+        """List lazy subcommands followed by the eagerly registered ones."""
+        eager = [name for name in super().list_commands(ctx) if name not in LAZY_COMMANDS]
+        return list(LAZY_COMMANDS) + eager
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> Optional[Any]:
+        """Get a command, returning a placeholder for lazy commands not yet loaded."""
+        if cmd_name in self._loaded:
+            return self._loaded[cmd_name]
+        if cmd_name in LAZY_COMMANDS:
+            return LazyCommand(cmd_name, LAZY_COMMANDS[cmd_name][1])
+        return super().get_command(ctx, cmd_name)
+
+    def resolve_command(self, ctx: typer.Context, args: List[str]):
+        """Resolve the command to execute, importing it if it is lazy."""
+        cmd_name = str(args[0]) if args else None
+        if cmd_name in LAZY_COMMANDS and cmd_name not in self._loaded:
+            self._loaded[cmd_name] = load_command(cmd_name)
+        return super().resolve_command(ctx, args)
+
+
+def load_command(name: str) -> Any:
+    """Import a registered subcommand and convert it to a click command."""
+    target, help_text = LAZY_COMMANDS[name]
+    module_name, attr = target.split(":")
+    obj = getattr(import_module(module_name), attr)
+
+    if isinstance(obj, typer.Typer):
+        command = typer.main.get_command(obj)
+    else:
+        wrapper = typer.Typer(add_completion=False)
+        wrapper.command(name=name, help=help_text)(obj)
+        command = typer.main.get_command(wrapper)
+
+    command.name = name
+    command.help = command.help or help_text
+    command.short_help = help_text
+    return command
 
-from fastinit.commands import init, new
 
 app = typer.Typer(
     name="fastinit",
     help="🚀 Bootstrap FastAPI applications with best practices",
     add_completion=True,
+    cls=LazyGroup,
 )
-console = Console()
-
-# Add init command directly
-app.command(name="init", help="Initialize a new FastAPI project")(init.main)
-
-# Add new subcommands
-app.add_typer(new.app, name="new", help="Generate new components (models, services, routes)")
 
 
 @app.command()
 def version():
     """Show the version of fastinit."""
+    from rich import print as rprint
+    from rich.panel import Panel
+
     from fastinit import __version__
 
     rprint(
@@ -5,12 +5,9 @@ from pathlib import Path
 from typing import Optional
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Confirm, Prompt
 from rich import print as rprint
 
-from fastinit.generators.project import ProjectGenerator
-from fastinit.models.config import ProjectConfig
+from fastinit.models.config import DB_DRIVERS, DB_TYPES, JSON_LIBRARIES, PROFILES, ProjectConfig
 
 console = Console()
 
@@ -29,9 +26,45 @@ def main(
         "--db-type",
         help="Database type (postgresql, mysql, sqlite)",
     ),
+    db_driver: str = typer.Option(
+        "sync",
+        "--db-driver",
+        help="Database driver mode: 'sync' or 'async' (asyncio SQLAlchemy engine)",
+    ),
     jwt: bool = typer.Option(False, "--jwt", help="Include JWT authentication with PyJWT"),
     logging: bool = typer.Option(False, "--logging", help="Include logging configuration"),
     docker: bool = typer.Option(False, "--docker", help="Include Docker configuration"),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Include a response cache module (in-memory or Redis) and its settings",
+    ),
+    metrics: bool = typer.Option(
+        False,
+        "--metrics",
+        help="Include Prometheus request and database metrics served at /metrics",
+    ),
+    profiling: bool = typer.Option(
+        False,
+        "--profiling",
+        help="Include a settings-gated middleware writing per-request profiles and SQL timings",
+    ),
+    bench: bool = typer.Option(
+        False,
+        "--bench",
+        help="Include an in-process load test reporting latency percentiles and RPS",
+    ),
+    json_library: str = typer.Option(
+        "std",
+        "--json",
+        help="JSON encoder for the default response class: 'std', 'orjson' or 'msgspec'",
+    ),
+    profile: str = typer.Option(
+        "development",
+        "--profile",
+        help="Deployment profile: 'development' or 'production' (multi-worker server, "
+        "multi-stage Docker build)",
+    ),
     interactive: bool = typer.Option(
         False,
         "--interactive",
@@ -59,8 +92,16 @@ def main(
 
         FastInit init my-project --db --jwt --logging
 
+        FastInit init my-project --db --docker --profile production
+
         FastInit init my-project --interactive
     """
+    # Imported here so that completion and --help do not load the generator stack
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.prompt import Confirm, Prompt
+
+    from fastinit.generators.project import ProjectGenerator
+
     # Display welcome banner
     rprint(
         Panel.fit(
@@ -76,18 +117,47 @@ def main(
         if db:
             db_type = Prompt.ask(
                 "Database type",
-                choices=["postgresql", "mysql", "sqlite"],
+                choices=DB_TYPES,
                 default=db_type,
             )
+            db_driver = Prompt.ask(
+                "Database driver",
+                choices=DB_DRIVERS,
+                default=db_driver,
+            )
         jwt = Confirm.ask("Include JWT authentication?", default=jwt)
         logging = Confirm.ask("Include logging configuration?", default=logging)
         docker = Confirm.ask("Include Docker configuration?", default=docker)
+        cache = Confirm.ask("Include response caching?", default=cache)
+        metrics = Confirm.ask("Include Prometheus metrics?", default=metrics)
+        profiling = Confirm.ask("Include request profiling?", default=profiling)
+        bench = Confirm.ask("Include a load-testing benchmark?", default=bench)
+        json_library = Prompt.ask("JSON encoder", choices=JSON_LIBRARIES, default=json_library)
+        profile = Prompt.ask("Deployment profile", choices=PROFILES, default=profile)
         python_version = Prompt.ask("Python version", default=python_version)
 
     # Validate database type
-    if db and db_type not in ["postgresql", "mysql", "sqlite"]:
+    if db and db_type not in DB_TYPES:
         console.print(f"[red]Error:[/red] Invalid database type '{db_type}'")
-        console.print("Valid options: postgresql, mysql, sqlite")
+        console.print(f"Valid options: {', '.join(DB_TYPES)}")
+        raise typer.Exit(1)
+
+    # Validate database driver
+    if db_driver not in DB_DRIVERS:
+        console.print(f"[red]Error:[/red] Invalid database driver '{db_driver}'")
+        console.print(f"Valid options: {', '.join(DB_DRIVERS)}")
+        raise typer.Exit(1)
+
+    # Validate JSON library
+    if json_library not in JSON_LIBRARIES:
+        console.print(f"[red]Error:[/red] Invalid JSON library '{json_library}'")
+        console.print(f"Valid options: {', '.join(JSON_LIBRARIES)}")
+        raise typer.Exit(1)
+
+    # Validate profile
+    if profile not in PROFILES:
+        console.print(f"[red]Error:[/red] Invalid profile '{profile}'")
+        console.print(f"Valid options: {', '.join(PROFILES)}")
         raise typer.Exit(1)
 
     # Set output directory
@@ -108,9 +178,16 @@ def main(
         output_dir=output_dir,
         use_db=db,
         db_type=db_type if db else None,
+        db_driver=db_driver,
         use_jwt=jwt,
         use_logging=logging,
         use_docker=docker,
+        use_cache=cache,
+        use_metrics=metrics,
+        use_bench=bench,
+        use_profiling=profiling,
+        json_library=json_library,
+        profile=profile,
         python_version=python_version,
     )
 
@@ -120,9 +197,17 @@ def main(
     console.print(f"  Location: [cyan]{project_path}[/cyan]")
     console.print(f"  Python Version: [cyan]{python_version}[/cyan]")
     console.print(f"  Database: [cyan]{db_type if db else 'None'}[/cyan]")
+    if db:
+        console.print(f"  DB Driver: [cyan]{db_driver}[/cyan]")
     console.print(f"  JWT Auth: [cyan]{'Yes' if jwt else 'No'}[/cyan]")
     console.print(f"  Logging: [cyan]{'Yes' if logging else 'No'}[/cyan]")
     console.print(f"  Docker: [cyan]{'Yes' if docker else 'No'}[/cyan]")
+    console.print(f"  Cache: [cyan]{'Yes' if cache else 'No'}[/cyan]")
+    console.print(f"  Metrics: [cyan]{'Yes' if metrics else 'No'}[/cyan]")
+    console.print(f"  Profiling: [cyan]{'Yes' if profiling else 'No'}[/cyan]")
+    console.print(f"  Benchmark: [cyan]{'Yes' if bench else 'No'}[/cyan]")
+    console.print(f"  JSON: [cyan]{json_library}[/cyan]")
+    console.print(f"  Profile: [cyan]{profile}[/cyan]")
     console.print()
 
     # Generate project
@@ -2,16 +2,39 @@
 
 import typer
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 from rich.console import Console
 from rich.panel import Panel
 
-from fastinit.generators.component import ComponentGenerator
-
-app = typer.Typer()
+from fastinit.models.spec import (
+    PAGINATION_TYPES,
+    SORTABLE_PAGINATION_TYPES,
+    indexed_columns,
+    keyset_index_columns,
+    parse_eager,
+    parse_fields,
+    parse_filters,
+    parse_index,
+    parse_sort,
+    parse_sortable,
+    validate_count,
+    validate_sort,
+)
+
+if TYPE_CHECKING:
+    from fastinit.generators.component import ComponentGenerator
+
+app = typer.Typer(add_completion=False)
 console = Console()
 
 
+def _get_generator(project_dir: Path) -> "ComponentGenerator":
+    """Create a component generator, importing the generator stack on demand."""
+    from fastinit.generators.component import ComponentGenerator
+
+    return ComponentGenerator(project_dir)
+
+
 @app.command()
 def model(
     name: str = typer.Argument(..., help="Name of the model to generate"),
@@ -25,29 +48,46 @@ def model(
         None,
         "--fields",
         "-f",
-        help="Fields in format 'name:type,email:str,age:int'",
+        help="Fields like 'name:str,email:str(320):unique,price:decimal(12,2)'",
+    ),
+    index: Optional[List[str]] = typer.Option(
+        None,
+        "--index",
+        help="Composite index columns, e.g. 'owner_id,created_at' (repeatable)",
+    ),
+    unique: Optional[List[str]] = typer.Option(
+        None,
+        "--unique",
+        help="Columns that are unique together, e.g. 'owner_id,name' (repeatable)",
     ),
 ):
     """
     Generate a new SQLAlchemy model.
 
+    Field types: str(length), text, int, float, decimal(precision,scale), bool,
+    datetime, date, enum(a,b,...), json and fk(table.column), each optionally
+    followed by :unique, :index or :nullable. Foreign keys are always indexed.
+
     Example:
         FastInit new model User --fields "name:str,email:str,age:int"
+        FastInit new model User --fields "email:str(320):unique:index,status:enum(active,banned)"
+        FastInit new model Order --fields "owner_id:fk(users.id)" --index "owner_id,created_at"
     """
     if project_dir is None:
         project_dir = Path.cwd()
 
     try:
-        generator = ComponentGenerator(project_dir)
+        generator = _get_generator(project_dir)
 
         # Parse fields if provided
-        field_dict = {}
-        if fields:
-            for field in fields.split(","):
-                field_name, field_type = field.split(":")
-                field_dict[field_name.strip()] = field_type.strip()
+        field_dict = parse_fields(fields) if fields else {}
 
-        generator.generate_model(name, field_dict if field_dict else None)
+        generator.generate_model(
+            name,
+            field_dict if field_dict else None,
+            indexes=[parse_index(columns, field_dict) for columns in index or []],
+            unique=[parse_index(columns, field_dict) for columns in unique or []],
+        )
 
         console.print(
             Panel.fit(
@@ -80,7 +120,17 @@ def service(
     pagination: str = typer.Option(
         "limit-offset",
         "--pagination",
-        help="Pagination type: 'limit-offset', 'cursor', or 'none'",
+        help="Pagination type: 'limit-offset', 'cursor', 'keyset', or 'none'",
+    ),
+    sort: Optional[str] = typer.Option(
+        None,
+        "--sort",
+        help="Keyset sort columns, e.g. '-created_at,-id' ('-' for descending)",
+    ),
+    eager: Optional[str] = typer.Option(
+        None,
+        "--eager",
+        help="Relationships to load with every read, e.g. 'tags,owner:joined'",
     ),
 ):
     """
@@ -89,22 +139,30 @@ def service(
     Example:
         FastInit new service UserService --model User
         FastInit new service UserService --pagination cursor
+        FastInit new service UserService --pagination keyset --sort "-created_at"
+        FastInit new service UserService --eager "roles,team:joined"
     """
     if project_dir is None:
         project_dir = Path.cwd()
 
     # Validate pagination option
-    valid_pagination = ["limit-offset", "cursor", "none"]
-    if pagination not in valid_pagination:
+    if pagination not in PAGINATION_TYPES:
         console.print(
             f"[red]Error:[/red] Invalid pagination type '{pagination}'. "
-            f"Must be one of: {', '.join(valid_pagination)}"
+            f"Must be one of: {', '.join(PAGINATION_TYPES)}"
         )
         raise typer.Exit(1)
 
     try:
-        generator = ComponentGenerator(project_dir)
-        generator.generate_service(name, model, pagination_type=pagination)
+        generator = _get_generator(project_dir)
+        sort_keys = parse_sort(sort) if sort else None
+        generator.generate_service(
+            name,
+            model,
+            pagination_type=pagination,
+            sort=sort_keys,
+            eager=parse_eager(eager) if eager else None,
+        )
 
         console.print(
             Panel.fit(
@@ -139,7 +197,12 @@ def route(
     pagination: str = typer.Option(
         "limit-offset",
         "--pagination",
-        help="Pagination type: 'limit-offset', 'cursor', or 'none'",
+        help="Pagination type: 'limit-offset', 'cursor', 'keyset', or 'none'",
+    ),
+    dump_json: bool = typer.Option(
+        False,
+        "--dump-json",
+        help="Serialize responses straight to JSON bytes with a Pydantic TypeAdapter",
     ),
 ):
     """
@@ -149,22 +212,22 @@ def route(
         FastInit new route users --service UserService
         FastInit new route users --pagination cursor
         FastInit new route users --pagination none
+        FastInit new route users --dump-json
     """
     if project_dir is None:
         project_dir = Path.cwd()
 
     # Validate pagination option
-    valid_pagination = ["limit-offset", "cursor", "none"]
-    if pagination not in valid_pagination:
+    if pagination not in PAGINATION_TYPES:
         console.print(
             f"[red]Error:[/red] Invalid pagination type '{pagination}'. "
-            f"Must be one of: {', '.join(valid_pagination)}"
+            f"Must be one of: {', '.join(PAGINATION_TYPES)}"
         )
         raise typer.Exit(1)
 
     try:
-        generator = ComponentGenerator(project_dir)
-        generator.generate_route(name, service, pagination_type=pagination)
+        generator = _get_generator(project_dir)
+        generator.generate_route(name, service, pagination_type=pagination, dump_json=dump_json)
 
         console.print(
             Panel.fit(
@@ -192,7 +255,7 @@ def schema(
         None,
         "--fields",
         "-f",
-        help="Fields in format 'name:type,email:str,age:int'",
+        help="Fields like 'name:str,email:str(320):unique,price:decimal(12,2)'",
     ),
 ):
     """
@@ -205,14 +268,10 @@ def schema(
         project_dir = Path.cwd()
 
     try:
-        generator = ComponentGenerator(project_dir)
+        generator = _get_generator(project_dir)
 
         # Parse fields if provided
-        field_dict = {}
-        if fields:
-            for field in fields.split(","):
-                field_name, field_type = field.split(":")
-                field_dict[field_name.strip()] = field_type.strip()
+        field_dict = parse_fields(fields) if fields else {}
 
         generator.generate_schema(name, field_dict if field_dict else None)
 
@@ -242,12 +301,77 @@ def crud(
         None,
         "--fields",
         "-f",
-        help="Fields in format 'name:type,email:str,age:int'",
+        help="Fields like 'name:str,email:str(320):unique,price:decimal(12,2)'",
     ),
     pagination: str = typer.Option(
         "limit-offset",
         "--pagination",
-        help="Pagination type: 'limit-offset', 'cursor', or 'none'",
+        help="Pagination type: 'limit-offset', 'cursor', 'keyset', or 'none'",
+    ),
+    sort: Optional[str] = typer.Option(
+        None,
+        "--sort",
+        help="Keyset sort columns, e.g. '-created_at,-id' ('-' for descending)",
+    ),
+    bulk: bool = typer.Option(
+        False,
+        "--bulk",
+        help="Add bulk create/update/delete endpoints and a test exercising them",
+    ),
+    eager: Optional[str] = typer.Option(
+        None,
+        "--eager",
+        help="Relationships to load with every read, e.g. 'tags,owner:joined'",
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Cache GET responses (with ETags) and invalidate them on every write",
+    ),
+    dump_json: bool = typer.Option(
+        False,
+        "--dump-json",
+        help="Serialize responses straight to JSON bytes and add a serialization benchmark",
+    ),
+    export: bool = typer.Option(
+        False,
+        "--export",
+        help="Add GET /<items>/export streaming every row as NDJSON or CSV",
+    ),
+    index: Optional[List[str]] = typer.Option(
+        None,
+        "--index",
+        help="Composite index columns, e.g. 'owner_id,created_at' (repeatable)",
+    ),
+    unique: Optional[List[str]] = typer.Option(
+        None,
+        "--unique",
+        help="Columns that are unique together, e.g. 'owner_id,name' (repeatable)",
+    ),
+    filter: Optional[str] = typer.Option(
+        None,
+        "--filter",
+        help="Indexed list filters, e.g. 'status:eq:in,price:range,name:prefix'",
+    ),
+    sortable: Optional[str] = typer.Option(
+        None,
+        "--sortable",
+        help="Indexed columns clients may sort the list by with ?sort=, e.g. 'price,created_at'",
+    ),
+    sparse: bool = typer.Option(
+        False,
+        "--sparse",
+        help="Let GET endpoints return only the fields named in ?fields=",
+    ),
+    core_reads: bool = typer.Option(
+        False,
+        "--core-reads",
+        help="Serve the list endpoint from Core rows instead of ORM objects, with a benchmark",
+    ),
+    count: Optional[str] = typer.Option(
+        None,
+        "--count",
+        help="Report list totals: 'exact' (cached COUNT(*)) or 'estimate' (planner estimates)",
     ),
 ):
     """
@@ -255,46 +379,67 @@ def crud(
 
     Example:
         FastInit new crud Product --fields "name:str,price:float,description:str"
+        FastInit new crud Product --fields "sku:str(32):unique,price:decimal(12,2)"
         FastInit new crud Product --pagination cursor
+        FastInit new crud Product --pagination keyset --sort "-created_at,-id"
         FastInit new crud Product --pagination none
+        FastInit new crud Product --bulk
+        FastInit new crud Country --cache
+        FastInit new crud Product --dump-json
+        FastInit new crud Event --export
+        FastInit new crud Product --fields "status:enum(draft,live):index,price:float:index"
+            --filter "status:eq:in,price:range" --sortable price
+        FastInit new crud Article --fields "title:str,body:text" --sparse
+        FastInit new crud Event --core-reads
+        FastInit new crud Event --pagination keyset --count estimate
     """
     if project_dir is None:
         project_dir = Path.cwd()
 
     # Validate pagination option
-    valid_pagination = ["limit-offset", "cursor", "none"]
-    if pagination not in valid_pagination:
+    if pagination not in PAGINATION_TYPES:
         console.print(
             f"[red]Error:[/red] Invalid pagination type '{pagination}'. "
-            f"Must be one of: {', '.join(valid_pagination)}"
+            f"Must be one of: {', '.join(PAGINATION_TYPES)}"
         )
         raise typer.Exit(1)
 
     try:
-        generator = ComponentGenerator(project_dir)
+        generator = _get_generator(project_dir)
 
         # Parse fields if provided
-        field_dict = {}
-        if fields:
-            for field in fields.split(","):
-                field_name, field_type = field.split(":")
-                field_dict[field_name.strip()] = field_type.strip()
+        field_dict = parse_fields(fields) if fields else {}
+
+        sort_keys = parse_sort(sort) if sort else None
+        if sort_keys:
+            validate_sort(sort_keys, field_dict)
+        eager_loads = parse_eager(eager) if eager else None
+        indexes = [parse_index(columns, field_dict) for columns in index or []]
+        unique_together = [parse_index(columns, field_dict) for columns in unique or []]
+        index_columns = keyset_index_columns(pagination, sort_keys)
+        indexed = indexed_columns(field_dict, index_columns, indexes, unique_together)
+        filters = parse_filters(filter, field_dict, indexed) if filter else {}
+        sort_columns = parse_sortable(sortable, field_dict, indexed) if sortable else []
+        if sort_columns and pagination not in SORTABLE_PAGINATION_TYPES:
+            raise ValueError(
+                f"{pagination} pagination fixes the order; --sortable needs one of: "
+                f"{', '.join(SORTABLE_PAGINATION_TYPES)}"
+            )
+        if count is not None:
+            validate_count(count, pagination)
 
         # Check if any files already exist before generating
-        model_file = generator.app_dir / "models" / f"{name.lower()}.py"
-        service_file = generator.app_dir / "services" / f"{name.lower()}_service.py"
-        route_file = generator.app_dir / "api" / "routes" / f"{name.lower()}s.py"
-        schema_file = generator.app_dir / "schemas" / f"{name.lower()}.py"
-
-        existing_files = []
-        if model_file.exists():
-            existing_files.append(f"app/models/{name.lower()}.py")
-        if service_file.exists():
-            existing_files.append(f"app/services/{name.lower()}_service.py")
-        if route_file.exists():
-            existing_files.append(f"app/api/routes/{name.lower()}s.py")
-        if schema_file.exists():
-            existing_files.append(f"app/schemas/{name.lower()}.py")
+        existing_files = generator.existing_crud_files(
+            name,
+            bulk=bulk,
+            cache=cache,
+            dump_json=dump_json,
+            export=export,
+            filtered=bool(filters or sort_columns),
+            sparse=sparse,
+            core_reads=core_reads,
+            count=count,
+        )
 
         if existing_files:
             console.print("[red]Error:[/red] The following files already exist:")
@@ -307,21 +452,78 @@ def crud(
 
         # Generate model
         console.print("  [cyan]→[/cyan] Creating model...")
-        generator.generate_model(name, field_dict if field_dict else None)
+        generator.generate_model(
+            name,
+            field_dict if field_dict else None,
+            index_columns=index_columns,
+            indexes=indexes,
+            unique=unique_together,
+        )
 
         # Generate schema
         console.print("  [cyan]→[/cyan] Creating schema...")
-        generator.generate_schema(name, field_dict if field_dict else None)
+        generator.generate_schema(
+            name,
+            field_dict if field_dict else None,
+            bulk=bulk,
+            filters=filters,
+            sortable=sort_columns,
+        )
 
         # Generate service
         console.print("  [cyan]→[/cyan] Creating service...")
         service_name = f"{name}Service"
-        generator.generate_service(service_name, name, pagination_type=pagination)
+        generator.generate_service(
+            service_name,
+            name,
+            pagination_type=pagination,
+            sort=sort_keys,
+            bulk=bulk,
+            eager=eager_loads,
+            cache=cache,
+            export=export,
+            fields=field_dict,
+            filters=filters,
+            sortable=sort_columns,
+            sparse=sparse,
+            core_reads=core_reads,
+            count=count,
+        )
 
         # Generate route
         console.print("  [cyan]→[/cyan] Creating route...")
         route_name = f"{name.lower()}s"
-        generator.generate_route(route_name, service_name, pagination_type=pagination)
+        generator.generate_route(
+            route_name,
+            service_name,
+            pagination_type=pagination,
+            model_name=name,
+            bulk=bulk,
+            cache=cache,
+            dump_json=dump_json,
+            export=export,
+            filtered=bool(filters or sort_columns),
+            sparse=sparse,
+            core_reads=core_reads,
+            count=count,
+        )
+
+        # Generate a test for each requested feature
+        test_files = generator.generate_feature_tests(
+            name,
+            field_dict,
+            pagination_type=pagination,
+            sort=sort_keys,
+            bulk=bulk,
+            cache=cache,
+            dump_json=dump_json,
+            export=export,
+            filters=filters,
+            sortable=sort_columns,
+            sparse=sparse,
+            core_reads=core_reads,
+            count=count,
+        )
 
         console.print()
         console.print(
@@ -335,6 +537,8 @@ def crud(
         console.print(f"  • [cyan]app/schemas/{name.lower()}.py[/cyan]")
         console.print(f"  • [cyan]app/services/{name.lower()}_service.py[/cyan]")
         console.print(f"  • [cyan]app/api/routes/{route_name}.py[/cyan]")
+        for test_file in test_files:
+            console.print(f"  • [cyan]{test_file}[/cyan]")
         console.print()
 
     except Exception as e:
@@ -342,5 +546,137 @@ def crud(
         raise typer.Exit(1)
 
 
+@app.command()
+def batch(
+    spec_file: Path = typer.Argument(..., help="Spec file (.yaml, .toml or .json)"),
+    project_dir: Optional[Path] = typer.Option(
+        None,
+        "--project-dir",
+        "-p",
+        help="Project directory (defaults to current directory)",
+    ),
+):
+    """
+    Generate CRUD components for many entities from a spec file.
+
+    Example spec (YAML):
+
+        defaults:
+          pagination: cursor
+        entities:
+          - name: Product
+            fields: "name:str:index,sku:str(32):unique,price:decimal(12,2):index"
+            pagination: limit-offset
+            filters: "name:prefix,price:range"
+            sortable: [price]
+            bulk: true
+          - name: Country
+            fields: "code:str,name:str"
+            cache: true
+            sparse: true
+            dump_json: true
+          - name: Event
+            fields: "owner_id:fk(users.id),kind:enum(click,view),payload:json"
+            pagination: keyset
+            sort: "-created_at"
+            indexes: ["owner_id,created_at"]
+            export: true
+            core_reads: true
+            count: estimate
+          - name: Tag
+            fields: {name: str}
+            layers: [model, schema]
+
+    Example:
+        FastInit new batch domain.yaml
+    """
+    import time
+
+    from rich.table import Table
+
+    from fastinit.models.spec import load_batch_spec
+
+    if project_dir is None:
+        project_dir = Path.cwd()
+
+    try:
+        spec = load_batch_spec(spec_file)
+        generator = _get_generator(project_dir)
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {str(e)}")
+        raise typer.Exit(1)
+
+    # Refuse to touch anything if any target file already exists
+    existing_files = [
+        file
+        for entity in spec.entities
+        for file in generator.existing_crud_files(
+            entity.name,
+            entity.layers,
+            bulk=entity.bulk,
+            cache=entity.cache,
+            dump_json=entity.dump_json,
+            export=entity.export,
+            filtered=bool(entity.filters or entity.sortable),
+            sparse=entity.sparse,
+            core_reads=entity.core_reads,
+            count=entity.count,
+        )
+    ]
+    if existing_files:
+        console.print("[red]Error:[/red] The following files already exist:")
+        for file in existing_files:
+            console.print(f"  • [yellow]{file}[/yellow]")
+        console.print("\nPlease delete these files or remove the entities from the spec.")
+        raise typer.Exit(1)
+
+    table = Table(title=f"Generated {len(spec.entities)} entities")
+    table.add_column("Entity", style="cyan")
+    table.add_column("Layers")
+    table.add_column("Pagination")
+    table.add_column("Time", justify="right")
+
+    started = time.perf_counter()
+    try:
+        for entity in spec.entities:
+            entity_started = time.perf_counter()
+            generator.generate_crud(
+                entity.name,
+                entity.fields or None,
+                pagination_type=entity.pagination,
+                layers=entity.layers,
+                sort=entity.sort,
+                bulk=entity.bulk,
+                eager=entity.eager,
+                cache=entity.cache,
+                dump_json=entity.dump_json,
+                export=entity.export,
+                indexes=entity.indexes,
+                unique=entity.unique,
+                filters=entity.filters,
+                sortable=entity.sortable,
+                sparse=entity.sparse,
+                core_reads=entity.core_reads,
+                count=entity.count,
+            )
+            elapsed_ms = (time.perf_counter() - entity_started) * 1000
+            table.add_row(
+                entity.name, ", ".join(entity.layers), entity.pagination, f"{elapsed_ms:.1f} ms"
+            )
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {str(e)}")
+        raise typer.Exit(1)
+    total_ms = (time.perf_counter() - started) * 1000
+
+    console.print(table)
+    console.print(
+        Panel.fit(
+            f"[bold green]✓[/bold green] {len(spec.entities)} entities generated "
+            f"in {total_ms:.1f} ms",
+            border_style="green",
+        )
+    )
+
+
 if __name__ == "__main__":
     app()
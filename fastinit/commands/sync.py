@@ -0,0 +1,88 @@
+"""Sync command to re-apply template updates to a generated project."""
+
+import typer
+from pathlib import Path
+from typing import Optional
+from rich.console import Console
+from rich.panel import Panel
+
+console = Console()
+
+
+def main(
+    project_dir: Optional[Path] = typer.Option(
+        None,
+        "--project-dir",
+        "-p",
+        help="Project directory (defaults to current directory)",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        "-n",
+        help="Show what would change without writing anything",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        "-f",
+        help="Overwrite generated files even if they were edited locally",
+    ),
+):
+    """
+    Update a generated project to the current fastinit templates.
+
+    Only files whose template or configuration changed are re-rendered, and
+    files you have edited since they were generated are left alone.
+
+    Examples:
+
+        FastInit sync
+
+        FastInit sync --dry-run
+    """
+    from fastinit.generators.sync import ProjectSynchronizer
+
+    if project_dir is None:
+        project_dir = Path.cwd()
+
+    try:
+        result = ProjectSynchronizer(project_dir).sync(dry_run=dry_run, force=force)
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {str(e)}")
+        raise typer.Exit(1)
+
+    for label, paths, style in [
+        ("create", result.created, "green"),
+        ("update", result.updated, "cyan"),
+    ]:
+        verb = f"would {label}" if dry_run else f"{label}d"
+        for path in paths:
+            console.print(f"  [{style}]{verb}[/{style}] {path}")
+
+    for path in result.conflicts:
+        console.print(f"  [yellow]skipped (edited locally)[/yellow] {path}")
+    for path in result.deleted:
+        console.print(f"  [yellow]skipped (deleted locally)[/yellow] {path}")
+    for path in result.untracked:
+        console.print(f"  [dim]no longer generated[/dim] {path}")
+
+    if not result.changed:
+        console.print(
+            Panel.fit("[bold green]✓[/bold green] Project is up to date", border_style="green")
+        )
+        return
+
+    summary = f"{len(result.created)} created, {len(result.updated)} updated"
+    if result.conflicts:
+        summary += f", {len(result.conflicts)} skipped"
+    console.print(
+        Panel.fit(
+            f"[bold green]✓[/bold green] {'Dry run: ' if dry_run else ''}{summary}",
+            border_style="green",
+        )
+    )
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -1,10 +1,52 @@
 """Component generator - creates individual components (models, services, routes)."""
 
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
+from fastinit.models.manifest import load_manifest
+from fastinit.models.spec import (
+    EAGER_LOADERS,
+    LAYERS,
+    FieldSpec,
+    column_fields,
+    keyset_index_columns,
+    parse_eager,
+    parse_sort,
+)
 from fastinit.templates import TemplateRenderer
 
+# Field types whose generated test values can be changed and compared exactly
+UPDATABLE_TEST_TYPES = ["str", "text", "int", "float"]
+# Templates of the tests generated for CRUD features, by their key in crud_files()
+FEATURE_TEST_TEMPLATES = {
+    "test": "test_bulk",
+    "cache_test": "test_cache",
+    "json_test": "test_json_benchmark",
+    "export_test": "test_export",
+    "filter_test": "test_filters",
+    "fieldset_test": "test_fieldsets",
+    "rows_test": "test_core_reads",
+    "count_test": "test_counts",
+}
+# Field types the generated services can look rows up by, when unique
+LOOKUP_FIELD_TYPES = ["str", "int", "fk"]
+
+
+def _updated_value(field: FieldSpec, var: str) -> str:
+    """Get a Python expression for a changed value of an updatable field, varying with ``var``.
+
+    Differs from the values the generated tests create records with.
+    """
+    if field.type == "int":
+        return f"-{var}"
+    if field.type == "float":
+        return f"{var} + 0.25"
+    value = f'f"updated-{{{var}}}"'
+    if field.length and field.length < 32:
+        # Keep the varying end, so values stay distinct for unique columns
+        value += f"[-{field.length}:]"
+    return value
+
 
 class ComponentGenerator:
     """Generates individual components for a FastAPI project."""
@@ -18,8 +60,53 @@ class ComponentGenerator:
         if not (self.app_dir / "main.py").exists():
             raise ValueError("Not a valid FastAPI project directory (app/main.py not found)")
 
-    def generate_model(self, name: str, fields: Optional[Dict[str, str]] = None):
-        """Generate a SQLAlchemy model."""
+        self.project_config = self._load_project_config()
+
+    @property
+    def async_db(self) -> bool:
+        """Whether the project uses the asyncio SQLAlchemy engine."""
+        return self.project_config.get("db_driver") == "async"
+
+    @property
+    def supports_returning(self) -> bool:
+        """Whether the project database supports INSERT/UPDATE ... RETURNING."""
+        return self.project_config.get("db_type") != "mysql"
+
+    def _load_project_config(self) -> Dict[str, Any]:
+        """Get the options the project was generated with.
+
+        Uses the project manifest when present, and otherwise inspects the
+        generated database session module.
+        """
+        manifest = load_manifest(self.project_dir)
+        if manifest is not None:
+            return manifest.config
+
+        session_file = self.app_dir / "db" / "session.py"
+        if not session_file.exists():
+            return {}
+        session_source = session_file.read_text(encoding="utf-8")
+        config_file = self.app_dir / "core" / "config.py"
+        config_source = config_file.read_text(encoding="utf-8") if config_file.exists() else ""
+        return {
+            "use_db": True,
+            "db_type": "mysql" if '"mysql' in config_source else None,
+            "db_driver": "async" if "create_async_engine" in session_source else "sync",
+        }
+
+    def generate_model(
+        self,
+        name: str,
+        fields: Optional[Dict[str, FieldSpec]] = None,
+        index_columns: Optional[Sequence[str]] = None,
+        indexes: Optional[Sequence[Sequence[str]]] = None,
+        unique: Optional[Sequence[Sequence[str]]] = None,
+    ):
+        """Generate a SQLAlchemy model.
+
+        ``index_columns`` is the index serving keyset pagination, ``indexes``
+        and ``unique`` are further composite indexes and unique constraints.
+        """
         model_file = self.app_dir / "models" / f"{name.lower()}.py"
 
         # Check if file already exists
@@ -29,17 +116,46 @@ class ComponentGenerator:
                 f"Please delete the file or use a different name."
             )
 
+        fields = fields or {}
+        index_columns = list(index_columns or [])
+        # The keyset index already covers an identical composite index
+        indexes = [list(columns) for columns in indexes or [] if list(columns) != index_columns]
+        unique = [list(columns) for columns in unique or []]
+
+        imports = {"Column", "Integer", "DateTime"}
+        for field in fields.values():
+            imports.update(field.sqlalchemy_types)
+        if index_columns or indexes:
+            imports.add("Index")
+        if unique:
+            imports.add("UniqueConstraint")
+
         context = {
             "model_name": name,
             "table_name": name.lower() + "s",
-            "fields": fields or {},
+            "fields": fields,
+            "index_columns": index_columns,
+            "indexes": indexes,
+            "unique": unique,
+            "sqlalchemy_imports": sorted(imports),
         }
 
         content = self.renderer.render("components/model.py.jinja", context)
         model_file.write_text(content, encoding="utf-8")
 
-    def generate_schema(self, name: str, fields: Optional[Dict[str, str]] = None):
-        """Generate Pydantic schemas."""
+    def generate_schema(
+        self,
+        name: str,
+        fields: Optional[Dict[str, FieldSpec]] = None,
+        bulk: bool = False,
+        filters: Optional[Dict[str, List[str]]] = None,
+        sortable: Optional[Sequence[str]] = None,
+    ):
+        """Generate Pydantic schemas.
+
+        ``bulk`` adds the bulk request schemas. ``filters`` and ``sortable``
+        add a ``<Name>Filter`` schema of the list endpoint's query parameters.
+        """
         schema_file = self.app_dir / "schemas" / f"{name.lower()}.py"
 
         # Check if file already exists
@@ -61,6 +177,10 @@ class ComponentGenerator:
         context = {
             "model_name": name,
             "fields": fields or {},
+            "bulk": bulk,
+            "filters": filters or {},
+            "sortable": list(sortable or []),
+            "columns": column_fields(fields or {}),
         }
 
         content = self.renderer.render("components/schema.py.jinja", context)
@@ -71,8 +191,31 @@ class ComponentGenerator:
         name: str,
         model_name: Optional[str] = None,
         pagination_type: str = "limit-offset",
+        sort: Optional[Sequence[str]] = None,
+        bulk: bool = False,
+        eager: Optional[Sequence[str]] = None,
+        cache: bool = False,
+        export: bool = False,
+        fields: Optional[Dict[str, FieldSpec]] = None,
+        filters: Optional[Dict[str, List[str]]] = None,
+        sortable: Optional[Sequence[str]] = None,
+        sparse: bool = False,
+        core_reads: bool = False,
+        count: Optional[str] = None,
     ):
-        """Generate a service class."""
+        """Generate a service class.
+
+        ``sort`` is the keyset pagination order, e.g. ``["-created_at", "id"]``.
+        ``fields`` adds a ``get_by_<field>`` lookup for each unique field.
+        ``filters`` and ``sortable`` make ``get_all`` take a ``<Name>Filter``.
+        ``sparse`` lets reads load only the columns of a field set.
+        ``core_reads`` adds ``get_all_rows``, reading response-shaped rows with Core.
+        ``count`` adds ``count``, totalling the list with that strategy ("exact" or "estimate").
+        ``bulk`` adds chunked bulk create/update/delete methods.
+        ``eager`` lists relationships to load with every read, e.g. ``["tags:selectin"]``.
+        ``cache`` adds cached reads returning JSON bodies, invalidated by every write.
+        ``export`` adds ``stream_all``, which reads every row in batches.
+        """
         # Remove 'Service' suffix if present for file naming
         service_base_name = name.replace("Service", "").lower()
         service_file = self.app_dir / "services" / f"{service_base_name}_service.py"
@@ -88,7 +231,43 @@ class ComponentGenerator:
             "service_name": name if name.endswith("Service") else f"{name}Service",
             "model_name": model_name or name.replace("Service", ""),
             "pagination_type": pagination_type,
+            "async_db": self.async_db,
+            "bulk": bulk,
+            "returning": self.supports_returning,
+            "cache": cache,
+            "cache_namespace": (model_name or name.replace("Service", "")).lower() + "s",
+            "export": export,
+            "eager": [],
+            "loaders": [],
+            "lookup_fields": [
+                field
+                for field in (fields or {}).values()
+                if field.unique and field.type in LOOKUP_FIELD_TYPES
+            ],
+            "filters": filters or {},
+            "sortable": list(sortable or []),
+            "sparse": sparse,
+            "core_reads": core_reads,
+            "count": count,
         }
+        for entry in parse_eager(eager or []):
+            relationship, strategy = entry.split(":")
+            context["eager"].append((relationship, EAGER_LOADERS[strategy]))
+        loaders = {loader for _, loader in context["eager"]}
+        context["loaders"] = sorted(loaders | {"load_only"} if sparse else loaders)
+        if pagination_type == "keyset":
+            sort_keys = parse_sort(sort or ["id"])
+            context["sort_columns"] = [key.lstrip("-") for key in sort_keys]
+            context["sort_descending"] = sort_keys[0].startswith("-")
+            self._ensure_pagination_module()
+        if cache:
+            self._ensure_cache_module()
+        if filters or sortable:
+            self._ensure_filters_module()
+        if sparse:
+            self._ensure_fieldsets_module()
+        if count:
+            self._ensure_counts_module()
 
         content = self.renderer.render("components/service.py.jinja", context)
         service_file.write_text(content, encoding="utf-8")
@@ -98,8 +277,30 @@ class ComponentGenerator:
         name: str,
         service_name: Optional[str] = None,
         pagination_type: str = "limit-offset",
+        model_name: Optional[str] = None,
+        bulk: bool = False,
+        cache: bool = False,
+        dump_json: bool = False,
+        export: bool = False,
+        filtered: bool = False,
+        sparse: bool = False,
+        core_reads: bool = False,
+        count: Optional[str] = None,
     ):
-        """Generate an API route."""
+        """Generate an API route, with /bulk endpoints if ``bulk``.
+
+        With ``cache``, GET endpoints serve the service's cached JSON bodies
+        with an ETag and answer ``If-None-Match`` with 304. With ``dump_json``,
+        responses are serialized straight to JSON bytes by a ``TypeAdapter``.
+        ``export`` adds a GET /export endpoint streaming the service's
+        ``stream_all`` as NDJSON or CSV. With ``filtered``, the list endpoint
+        reads the ``<Name>Filter`` schema from its query parameters. With
+        ``sparse``, GET endpoints take ``?fields=`` to return only some fields.
+        With ``core_reads``, the list endpoint serializes the plain rows of
+        the service's ``get_all_rows`` without validating them. With
+        ``count``, the list endpoint reports the service's total, in the page
+        envelope for keyset pagination and in X-Total-Count headers otherwise.
+        """
         # Ensure plural form for route name
         route_name = name if name.endswith("s") else f"{name}s"
         route_file = self.app_dir / "api" / "routes" / f"{route_name.lower()}.py"
@@ -111,15 +312,399 @@ class ComponentGenerator:
                 f"Please delete the file or use a different name."
             )
 
-        # Derive model name from route name (singular)
-        model_name = route_name.rstrip("s").capitalize()
+        # Derive model name from route name (singular) unless given
+        model_name = model_name or route_name.rstrip("s").capitalize()
 
         context = {
             "route_name": route_name,
             "model_name": model_name,
             "service_name": service_name or f"{model_name}Service",
             "pagination_type": pagination_type,
+            "async_db": self.async_db,
+            "bulk": bulk,
+            "cache": cache,
+            "dump_json": dump_json,
+            "export": export,
+            "filtered": filtered,
+            "sparse": sparse,
+            "core_reads": core_reads,
+            "count": count,
         }
+        if pagination_type == "keyset":
+            self._ensure_pagination_module()
+        if cache:
+            self._ensure_cache_module()
+        if count:
+            self._ensure_counts_module()
+        if filtered:
+            self._ensure_filters_module()
+        if sparse:
+            self._ensure_fieldsets_module()
+        if dump_json:
+            self._ensure_responses_module()
+        if export:
+            self._ensure_export_module()
 
         content = self.renderer.render("components/route.py.jinja", context)
         route_file.write_text(content, encoding="utf-8")
+
+    def generate_feature_tests(
+        self,
+        name: str,
+        fields: Optional[Dict[str, FieldSpec]] = None,
+        layers: Sequence[str] = LAYERS,
+        *,
+        pagination_type: str = "limit-offset",
+        sort: Optional[Sequence[str]] = None,
+        bulk: bool = False,
+        cache: bool = False,
+        dump_json: bool = False,
+        export: bool = False,
+        filters: Optional[Dict[str, List[str]]] = None,
+        sortable: Optional[Sequence[str]] = None,
+        sparse: bool = False,
+        core_reads: bool = False,
+        count: Optional[str] = None,
+    ) -> List[str]:
+        """Generate a test for each CRUD feature of an entity that has the layers it needs.
+
+        Returns:
+            Paths of the generated tests, relative to the project
+        """
+        files = self.crud_files(
+            name,
+            layers,
+            bulk=bulk,
+            cache=cache,
+            dump_json=dump_json,
+            export=export,
+            filtered=bool(filters or sortable),
+            sparse=sparse,
+            core_reads=core_reads,
+            count=count,
+        )
+        tests = {key: path for key, path in files.items() if key in FEATURE_TEST_TEMPLATES}
+
+        fields = fields or {}
+        update_field = next(
+            (field for field in fields.values() if field.type in UPDATABLE_TEST_TYPES), None
+        )
+        # SQLite stores server-set timestamps in a different text format than bound
+        # datetimes, so they cannot be compared exactly in the test database
+        filters = {
+            column: operators
+            for column, operators in (filters or {}).items()
+            if column not in ("created_at", "updated_at")
+        }
+        context = {
+            "model_name": name,
+            "route_name": f"{name.lower()}s",
+            "service_name": f"{name}Service",
+            "async_db": self.async_db,
+            "json_library": self.project_config.get("json_library", "std"),
+            "pagination_type": pagination_type,
+            "cache": cache,
+            "count": count,
+            "related_models": self._related_model_modules(fields),
+            "update_field": update_field.name if update_field else None,
+            "update_value": _updated_value(update_field, "id") if update_field else None,
+            "numeric_columns": [
+                field.name for field in fields.values() if field.type in ("float", "decimal")
+            ],
+            "eq_columns": [column for column, ops in filters.items() if "eq" in ops],
+            "in_columns": [column for column, ops in filters.items() if "in" in ops],
+            "range_columns": [column for column, ops in filters.items() if "range" in ops],
+            "prefix_columns": [column for column, ops in filters.items() if "prefix" in ops],
+            "sortable": list(sortable or []),
+            "field": next(iter(fields), "created_at"),
+            "paging_columns": (
+                [key.lstrip("-") for key in parse_sort(sort or ["id"])]
+                if pagination_type == "keyset"
+                else []
+            ),
+        }
+
+        for key, test_file in tests.items():
+            self._generate_feature_test(test_file, FEATURE_TEST_TEMPLATES[key], context)
+        return [path.relative_to(self.project_dir).as_posix() for path in tests.values()]
+
+    def _generate_feature_test(self, test_file: Path, template: str, context: Dict[str, Any]):
+        """Render the test template ``components/<template>.py.jinja`` to ``test_file``."""
+        # Check if file already exists
+        if test_file.exists():
+            raise FileExistsError(
+                f"Test file already exists: {test_file}\n"
+                f"Please delete the file or use a different name."
+            )
+
+        self._ensure_test_config()
+        content = self.renderer.render(f"components/{template}.py.jinja", context)
+        test_file.write_text(content, encoding="utf-8")
+
+    def _related_model_modules(self, fields: Optional[Dict[str, FieldSpec]]) -> List[str]:
+        """Get the model modules defining the tables that ``fields`` reference.
+
+        Generated tests import them so ``create_all`` can resolve foreign keys.
+        """
+        tables = {
+            field.references.split(".")[0] for field in (fields or {}).values() if field.references
+        }
+        modules = []
+        for model_file in sorted((self.app_dir / "models").glob("*.py")):
+            source = model_file.read_text(encoding="utf-8")
+            if any(f'__tablename__ = "{table}"' in source for table in tables):
+                modules.append(model_file.stem)
+        return modules
+
+    def _ensure_test_config(self):
+        """Write a conftest.py with the shared test fixtures, unless present."""
+        conftest_file = self.project_dir / "tests" / "conftest.py"
+        if conftest_file.exists():
+            return
+        conftest_file.parent.mkdir(parents=True, exist_ok=True)
+        context = {"use_db": True, "async_db": self.async_db}
+        content = self.renderer.render("components/conftest.py.jinja", context)
+        conftest_file.write_text(content, encoding="utf-8")
+
+    def _ensure_cache_module(self):
+        """Write the response cache module unless the project has it."""
+        cache_file = self.app_dir / "core" / "cache.py"
+        if cache_file.exists():
+            return
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        content = self.renderer.render("components/cache.py.jinja", {"async_db": self.async_db})
+        cache_file.write_text(content, encoding="utf-8")
+
+    def _ensure_responses_module(self):
+        """Write the JSON response helpers unless the project has them."""
+        responses_file = self.app_dir / "core" / "responses.py"
+        if responses_file.exists():
+            return
+        responses_file.parent.mkdir(parents=True, exist_ok=True)
+        context = {"json_library": self.project_config.get("json_library", "std")}
+        content = self.renderer.render("components/responses.py.jinja", context)
+        responses_file.write_text(content, encoding="utf-8")
+
+    def _ensure_export_module(self):
+        """Write the streaming NDJSON/CSV encoders unless the project has them."""
+        export_file = self.app_dir / "core" / "export.py"
+        if export_file.exists():
+            return
+        export_file.parent.mkdir(parents=True, exist_ok=True)
+        content = self.renderer.render("components/export.py.jinja", {"async_db": self.async_db})
+        export_file.write_text(content, encoding="utf-8")
+
+    def _ensure_filters_module(self):
+        """Write the shared list filtering helpers unless the project has them."""
+        filters_file = self.app_dir / "core" / "filters.py"
+        if filters_file.exists():
+            return
+        filters_file.parent.mkdir(parents=True, exist_ok=True)
+        content = self.renderer.render("components/filters.py.jinja", {})
+        filters_file.write_text(content, encoding="utf-8")
+
+    def _ensure_fieldsets_module(self):
+        """Write the shared sparse fieldset helpers unless the project has them."""
+        fieldsets_file = self.app_dir / "core" / "fieldsets.py"
+        if fieldsets_file.exists():
+            return
+        fieldsets_file.parent.mkdir(parents=True, exist_ok=True)
+        content = self.renderer.render("components/fieldsets.py.jinja", {})
+        fieldsets_file.write_text(content, encoding="utf-8")
+
+    def _ensure_counts_module(self):
+        """Write the shared list total helpers unless the project has them."""
+        counts_file = self.app_dir / "core" / "counts.py"
+        if counts_file.exists():
+            return
+        # CountedPage extends the keyset Page
+        self._ensure_pagination_module()
+        content = self.renderer.render("components/counts.py.jinja", {"async_db": self.async_db})
+        counts_file.write_text(content, encoding="utf-8")
+
+    def _ensure_pagination_module(self):
+        """Write the shared keyset pagination helpers unless the project has them."""
+        pagination_file = self.app_dir / "core" / "pagination.py"
+        if pagination_file.exists():
+            return
+        pagination_file.parent.mkdir(parents=True, exist_ok=True)
+        content = self.renderer.render("components/pagination.py.jinja", {})
+        pagination_file.write_text(content, encoding="utf-8")
+
+    def crud_files(
+        self,
+        name: str,
+        layers: Sequence[str] = LAYERS,
+        *,
+        bulk: bool = False,
+        cache: bool = False,
+        dump_json: bool = False,
+        export: bool = False,
+        filtered: bool = False,
+        sparse: bool = False,
+        core_reads: bool = False,
+        count: Optional[str] = None,
+    ) -> Dict[str, Path]:
+        """Get the files a CRUD setup for ``name`` writes, keyed by layer."""
+        paths = {
+            "model": self.app_dir / "models" / f"{name.lower()}.py",
+            "schema": self.app_dir / "schemas" / f"{name.lower()}.py",
+            "service": self.app_dir / "services" / f"{name.lower()}_service.py",
+            "route": self.app_dir / "api" / "routes" / f"{name.lower()}s.py",
+        }
+        files = {layer: path for layer, path in paths.items() if layer in layers}
+        if bulk and "route" in layers:
+            files["test"] = self.project_dir / "tests" / f"test_{name.lower()}s_bulk.py"
+        if cache and {"service", "route"} <= set(layers):
+            files["cache_test"] = self.project_dir / "tests" / f"test_{name.lower()}s_cache.py"
+        if dump_json and "route" in layers:
+            files["json_test"] = self.project_dir / "tests" / f"test_{name.lower()}s_json.py"
+        if export and {"service", "route"} <= set(layers):
+            files["export_test"] = self.project_dir / "tests" / f"test_{name.lower()}s_export.py"
+        if filtered and {"schema", "service", "route"} <= set(layers):
+            files["filter_test"] = self.project_dir / "tests" / f"test_{name.lower()}s_filters.py"
+        if sparse and {"service", "route"} <= set(layers):
+            files["fieldset_test"] = self.project_dir / "tests" / f"test_{name.lower()}s_fields.py"
+        if core_reads and {"schema", "service"} <= set(layers):
+            files["rows_test"] = self.project_dir / "tests" / f"test_{name.lower()}s_rows.py"
+        if count and {"service", "route"} <= set(layers):
+            files["count_test"] = self.project_dir / "tests" / f"test_{name.lower()}s_count.py"
+        return files
+
+    def existing_crud_files(
+        self,
+        name: str,
+        layers: Sequence[str] = LAYERS,
+        *,
+        bulk: bool = False,
+        cache: bool = False,
+        dump_json: bool = False,
+        export: bool = False,
+        filtered: bool = False,
+        sparse: bool = False,
+        core_reads: bool = False,
+        count: Optional[str] = None,
+    ) -> List[str]:
+        """List CRUD files for ``name`` that already exist, relative to the project."""
+        files = self.crud_files(
+            name,
+            layers,
+            bulk=bulk,
+            cache=cache,
+            dump_json=dump_json,
+            export=export,
+            filtered=filtered,
+            sparse=sparse,
+            core_reads=core_reads,
+            count=count,
+        )
+        return [
+            path.relative_to(self.project_dir).as_posix()
+            for path in files.values()
+            if path.exists()
+        ]
+
+    def generate_crud(
+        self,
+        name: str,
+        fields: Optional[Dict[str, FieldSpec]] = None,
+        *,
+        pagination_type: str = "limit-offset",
+        layers: Sequence[str] = LAYERS,
+        sort: Optional[Sequence[str]] = None,
+        bulk: bool = False,
+        eager: Optional[Sequence[str]] = None,
+        cache: bool = False,
+        dump_json: bool = False,
+        export: bool = False,
+        indexes: Optional[Sequence[Sequence[str]]] = None,
+        unique: Optional[Sequence[Sequence[str]]] = None,
+        filters: Optional[Dict[str, List[str]]] = None,
+        sortable: Optional[Sequence[str]] = None,
+        sparse: bool = False,
+        core_reads: bool = False,
+        count: Optional[str] = None,
+    ) -> List[str]:
+        """Generate the requested CRUD layers for an entity.
+
+        Returns:
+            Paths of the generated files, relative to the project
+        """
+        service_name = f"{name}Service"
+
+        if "model" in layers:
+            self.generate_model(
+                name,
+                fields,
+                index_columns=keyset_index_columns(pagination_type, sort),
+                indexes=indexes,
+                unique=unique,
+            )
+        filtered = bool(filters or sortable) and {"schema", "service"} <= set(layers)
+        sparse = sparse and {"service", "route"} <= set(layers)
+        core_reads = core_reads and {"schema", "service"} <= set(layers)
+        count = count if {"service", "route"} <= set(layers) else None
+        if "schema" in layers:
+            self.generate_schema(name, fields, bulk=bulk, filters=filters, sortable=sortable)
+        if "service" in layers:
+            self.generate_service(
+                service_name,
+                name,
+                pagination_type=pagination_type,
+                sort=sort,
+                bulk=bulk,
+                eager=eager,
+                cache=cache,
+                export=export,
+                fields=fields,
+                filters=filters if filtered else None,
+                sortable=sortable if filtered else None,
+                sparse=sparse,
+                core_reads=core_reads,
+                count=count,
+            )
+        if "route" in layers:
+            self.generate_route(
+                f"{name.lower()}s",
+                service_name,
+                pagination_type=pagination_type,
+                model_name=name,
+                bulk=bulk,
+                cache=cache and "service" in layers,
+                dump_json=dump_json,
+                export=export and "service" in layers,
+                filtered=filtered,
+                sparse=sparse,
+                core_reads=core_reads,
+                count=count,
+            )
+        self.generate_feature_tests(
+            name,
+            fields,
+            layers,
+            pagination_type=pagination_type,
+            sort=sort,
+            bulk=bulk,
+            cache=cache,
+            dump_json=dump_json,
+            export=export,
+            filters=filters if filtered else None,
+            sortable=sortable if filtered else None,
+            sparse=sparse,
+            core_reads=core_reads,
+            count=count,
+        )
+
+        files = self.crud_files(
+            name,
+            layers,
+            bulk=bulk,
+            cache=cache,
+            dump_json=dump_json,
+            export=export,
+            filtered=filtered,
+            sparse=sparse,
+            core_reads=core_reads,
+            count=count,
+        )
+        return [path.relative_to(self.project_dir).as_posix() for path in files.values()]
@@ -1,11 +1,32 @@
 """Project generator - creates the complete FastAPI project structure."""
 
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+import hashlib
+import json
+import os
 import shutil
+import uuid
 
+from fastinit import __version__
 from fastinit.models.config import ProjectConfig
+from fastinit.models.manifest import MANIFEST_PATH, FileRecord, ProjectManifest, hash_content
 from fastinit.templates import TemplateRenderer
 
+# Number of threads used to write rendered files into the staging directory
+WRITE_WORKERS = 8
+
+
+@dataclass
+class PlannedFile:
+    """A project file to generate, from a template or from literal content."""
+
+    template: Optional[str] = None
+    context: Dict[str, Any] = field(default_factory=dict)
+    content: str = ""
+
 
 class ProjectGenerator:
     """Generates a complete FastAPI project structure."""
@@ -13,11 +34,74 @@ class ProjectGenerator:
     def __init__(self, config: ProjectConfig):
         self.config = config
         self.renderer = TemplateRenderer()
+        self._plan: Dict[str, PlannedFile] = {}
+        self._directories: List[str] = []
 
     def generate(self):
-        """Generate the complete project structure."""
-        # Create project directory
-        self._create_directory_structure()
+        """Generate the complete project structure.
+
+        All files are rendered in memory first, written into a staging
+        directory next to the project and then renamed into place, so a
+        failure never leaves a half-written project behind.
+        """
+        files = self.render()
+        files[MANIFEST_PATH] = self.build_manifest(files).to_json()
+        self._commit(files)
+
+    def render(self) -> Dict[str, str]:
+        """Render every project file into memory.
+
+        Returns:
+            Mapping of project-relative path to file content
+        """
+        return {path: self.render_file(planned) for path, planned in self.plan().items()}
+
+    def render_file(self, planned: PlannedFile) -> str:
+        """Render a single planned file."""
+        if planned.template is None:
+            return planned.content
+        return self.renderer.render(planned.template, planned.context)
+
+    def fingerprint(self, planned: PlannedFile) -> str:
+        """Hash everything a planned file's content depends on.
+
+        Files whose fingerprint matches the manifest do not need re-rendering.
+        """
+        if planned.template is None:
+            source = planned.content
+        else:
+            source = self.renderer.get_source(planned.template)
+
+        hasher = hashlib.sha256(source.encode("utf-8"))
+        hasher.update(json.dumps(planned.context, sort_keys=True, default=str).encode("utf-8"))
+        return hasher.hexdigest()
+
+    def build_manifest(self, files: Dict[str, str]) -> ProjectManifest:
+        """Build the manifest recording config, version and generated hashes."""
+        return ProjectManifest(
+            fastinit_version=__version__,
+            config=self.config.to_dict(),
+            files={
+                path: FileRecord(
+                    sha256=hash_content(files[path]),
+                    inputs=self.fingerprint(planned),
+                    template=planned.template,
+                )
+                for path, planned in self._plan.items()
+            },
+        )
+
+    def plan(self) -> Dict[str, PlannedFile]:
+        """Work out which files the project consists of, without rendering them.
+
+        Returns:
+            Mapping of project-relative path to planned file
+        """
+        self._plan = {}
+        self._directories = []
+
+        # Plan project directories
+        self._plan_directory_structure()
 
         # Generate files
         self._generate_main_files()
@@ -33,6 +117,27 @@ class ProjectGenerator:
         if self.config.use_jwt:
             self._generate_security_files()
 
+        if self.config.use_logging:
+            self._generate_logging_files()
+
+        if self.config.use_cache:
+            self._generate_cache_files()
+
+        if self.config.use_metrics:
+            self._generate_metrics_files()
+
+        if self.config.use_profiling:
+            self._generate_profiling_files()
+
+        if self.config.use_bench:
+            self._generate_bench_files()
+
+        if self.config.json_library != "std":
+            self._generate_response_files()
+
+        if self.config.profile == "production":
+            self._generate_server_files()
+
         if self.config.use_docker:
             self._generate_docker_files()
 
@@ -41,38 +146,32 @@ class ProjectGenerator:
         self._generate_gitignore()
         self._generate_readme()
 
-    def _create_directory_structure(self):
-        """Create the project directory structure."""
-        project_path = self.config.project_path
-
-        # Clean up if force mode
-        if project_path.exists():
-            shutil.rmtree(project_path)
+        return dict(self._plan)
 
-        # Create directories
+    def _plan_directory_structure(self):
+        """Plan the project directory structure and package markers."""
         directories = [
-            project_path,
-            project_path / "app",
-            project_path / "app" / "api",
-            project_path / "app" / "api" / "routes",
-            project_path / "app" / "core",
-            project_path / "app" / "models",
-            project_path / "app" / "services",
-            project_path / "app" / "schemas",
-            project_path / "tests",
+            "app",
+            "app/api",
+            "app/api/routes",
+            "app/core",
+            "app/models",
+            "app/services",
+            "app/schemas",
+            "tests",
         ]
 
         if self.config.use_db:
-            directories.append(project_path / "app" / "db")
-            directories.append(project_path / "alembic")
-            directories.append(project_path / "alembic" / "versions")
+            directories.append("app/db")
+            directories.append("alembic")
+            directories.append("alembic/versions")
 
         for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+            self._directories.append(directory)
 
             # Create __init__.py files
             # Note: "app" is excluded as it's the root package directory
-            if directory.name in [
+            if directory.rsplit("/", 1)[-1] in [
                 "api",
                 "routes",
                 "core",
@@ -82,136 +181,179 @@ class ProjectGenerator:
                 "db",
                 "tests",
             ]:
-                (directory / "__init__.py").touch()
+                self._add_file(f"{directory}/__init__.py", "")
 
     def _generate_main_files(self):
         """Generate main application files."""
         context = self._get_template_context()
 
         # Generate main.py
-        main_content = self.renderer.render("main.py.jinja", context)
-        self._write_file("app/main.py", main_content)
+        self._render_file("app/main.py", "main.py.jinja", context)
 
     def _generate_config_files(self):
         """Generate configuration files."""
         context = self._get_template_context()
 
         # Generate config.py
-        config_content = self.renderer.render("core/config.py.jinja", context)
-        self._write_file("app/core/config.py", config_content)
+        self._render_file("app/core/config.py", "core/config.py.jinja", context)
 
     def _generate_api_files(self):
         """Generate API-related files."""
         context = self._get_template_context()
 
         # Generate deps.py
-        deps_content = self.renderer.render("api/deps.py.jinja", context)
-        self._write_file("app/api/deps.py", deps_content)
+        self._render_file("app/api/deps.py", "api/deps.py.jinja", context)
 
         # Generate health route
-        health_content = self.renderer.render("api/routes/health.py.jinja", context)
-        self._write_file("app/api/routes/health.py", health_content)
+        self._render_file("app/api/routes/health.py", "api/routes/health.py.jinja", context)
 
     def _generate_core_files(self):
         """Generate core module files."""
         context = self._get_template_context()
 
         # Generate core __init__.py
-        init_content = self.renderer.render("core/__init__.py.jinja", context)
-        self._write_file("app/core/__init__.py", init_content)
+        self._render_file("app/core/__init__.py", "core/__init__.py.jinja", context)
 
     def _generate_db_files(self):
         """Generate database-related files."""
         context = self._get_template_context()
 
         # Generate session.py
-        session_content = self.renderer.render("db/session.py.jinja", context)
-        self._write_file("app/db/session.py", session_content)
+        self._render_file("app/db/session.py", "db/session.py.jinja", context)
 
         # Generate base.py
-        base_content = self.renderer.render("db/base.py.jinja", context)
-        self._write_file("app/db/base.py", base_content)
+        self._render_file("app/db/base.py", "db/base.py.jinja", context)
 
     def _generate_models_files(self):
         """Generate models directory files."""
         context = self._get_template_context()
 
         # Generate models __init__.py
-        init_content = self.renderer.render("models/__init__.py.jinja", context)
-        self._write_file("app/models/__init__.py", init_content)
+        self._render_file("app/models/__init__.py", "models/__init__.py.jinja", context)
 
     def _generate_alembic_files(self):
         """Generate Alembic migration configuration files."""
         context = self._get_template_context()
 
         # Generate alembic.ini
-        alembic_ini_content = self.renderer.render("alembic.ini.jinja", context)
-        self._write_file("alembic.ini", alembic_ini_content)
+        self._render_file("alembic.ini", "alembic.ini.jinja", context)
 
         # Generate alembic/env.py
-        env_content = self.renderer.render("alembic/env.py.jinja", context)
-        self._write_file("alembic/env.py", env_content)
+        self._render_file("alembic/env.py", "alembic/env.py.jinja", context)
 
         # Generate alembic/script.py.mako
-        script_mako_content = self.renderer.render("alembic/script.py.mako.jinja", context)
-        self._write_file("alembic/script.py.mako", script_mako_content)
+        self._render_file("alembic/script.py.mako", "alembic/script.py.mako.jinja", context)
 
         # Generate alembic/README.md
-        alembic_readme_content = self.renderer.render("alembic/README.jinja", context)
-        self._write_file("alembic/README.md", alembic_readme_content)
+        self._render_file("alembic/README.md", "alembic/README.jinja", context)
 
         # Create .gitkeep in versions directory to ensure it's tracked
-        self._write_file("alembic/versions/.gitkeep", "")
+        self._add_file("alembic/versions/.gitkeep", "")
 
     def _generate_security_files(self):
         """Generate security-related files for JWT."""
         context = self._get_template_context()
 
         # Generate security.py
-        security_content = self.renderer.render("core/security.py.jinja", context)
-        self._write_file("app/core/security.py", security_content)
+        self._render_file("app/core/security.py", "core/security.py.jinja", context)
+
+        # Generate tests for the JWKS key cache
+        self._render_file("tests/conftest.py", "components/conftest.py.jinja", context)
+        self._render_file("tests/test_security.py", "tests/test_security.py.jinja", context)
+
+    def _generate_logging_files(self):
+        """Generate the logging setup and request logging middleware."""
+        context = self._get_template_context()
+
+        # Generate logging.py and its tests
+        self._render_file("app/core/logging.py", "core/logging.py.jinja", context)
+        self._render_file("tests/conftest.py", "components/conftest.py.jinja", context)
+        self._render_file("tests/test_logging.py", "tests/test_logging.py.jinja", context)
+
+    def _generate_cache_files(self):
+        """Generate the response cache module."""
+        context = self._get_template_context()
+
+        # Generate cache.py, which `fastinit new crud --cache` services use
+        self._render_file("app/core/cache.py", "components/cache.py.jinja", context)
+
+    def _generate_metrics_files(self):
+        """Generate the Prometheus metrics module and its benchmark."""
+        context = self._get_template_context()
+
+        # Generate metrics.py
+        self._render_file("app/core/metrics.py", "core/metrics.py.jinja", context)
+
+        # Generate tests, including the middleware overhead benchmark
+        self._render_file("tests/conftest.py", "components/conftest.py.jinja", context)
+        self._render_file("tests/test_metrics.py", "tests/test_metrics.py.jinja", context)
+
+    def _generate_profiling_files(self):
+        """Generate the request profiling middleware."""
+        context = self._get_template_context()
+
+        # Generate profiling.py and its tests
+        self._render_file("app/core/profiling.py", "core/profiling.py.jinja", context)
+        self._render_file("tests/conftest.py", "components/conftest.py.jinja", context)
+        self._render_file("tests/test_profiling.py", "tests/test_profiling.py.jinja", context)
+
+    def _generate_bench_files(self):
+        """Generate the in-process load test."""
+        context = self._get_template_context()
+
+        # Generate loadtest.py, which benchmarks the routers added with `fastinit new`
+        self._render_file("bench/loadtest.py", "bench/loadtest.py.jinja", context)
+
+    def _generate_response_files(self):
+        """Generate the JSON response module with the default response class."""
+        context = self._get_template_context()
+
+        # Generate responses.py
+        self._render_file("app/core/responses.py", "components/responses.py.jinja", context)
+
+    def _generate_server_files(self):
+        """Generate the production server entry point."""
+        context = self._get_template_context()
+
+        # Generate serve.py and its test
+        self._render_file("app/serve.py", "serve.py.jinja", context)
+        self._render_file("tests/conftest.py", "components/conftest.py.jinja", context)
+        self._render_file("tests/test_serve.py", "tests/test_serve.py.jinja", context)
 
     def _generate_docker_files(self):
         """Generate Docker configuration files."""
         context = self._get_template_context()
 
         # Generate Dockerfile
-        dockerfile_content = self.renderer.render("Dockerfile.jinja", context)
-        self._write_file("Dockerfile", dockerfile_content)
+        self._render_file("Dockerfile", "Dockerfile.jinja", context)
 
         # Generate docker-compose.yml
-        compose_content = self.renderer.render("docker-compose.yml.jinja", context)
-        self._write_file("docker-compose.yml", compose_content)
+        self._render_file("docker-compose.yml", "docker-compose.yml.jinja", context)
 
         # Generate .dockerignore
-        dockerignore_content = self.renderer.render("dockerignore.jinja", context)
-        self._write_file(".dockerignore", dockerignore_content)
+        self._render_file(".dockerignore", "dockerignore.jinja", context)
 
     def _generate_pyproject(self):
         """Generate pyproject.toml file."""
         context = self._get_template_context()
 
-        pyproject_content = self.renderer.render("pyproject.toml.jinja", context)
-        self._write_file("pyproject.toml", pyproject_content)
+        self._render_file("pyproject.toml", "pyproject.toml.jinja", context)
 
     def _generate_env_file(self):
         """Generate .env.example file."""
         context = self._get_template_context()
 
-        env_content = self.renderer.render("env.example.jinja", context)
-        self._write_file(".env.example", env_content)
+        self._render_file(".env.example", "env.example.jinja", context)
 
     def _generate_gitignore(self):
         """Generate .gitignore file."""
-        gitignore_content = self.renderer.render("gitignore.jinja", {})
-        self._write_file(".gitignore", gitignore_content)
+        self._render_file(".gitignore", "gitignore.jinja", {})
 
     def _generate_readme(self):
         """Generate README.md file."""
         context = self._get_template_context()
 
-        readme_content = self.renderer.render("README.md.jinja", context)
-        self._write_file("README.md", readme_content)
+        self._render_file("README.md", "README.md.jinja", context)
 
     def _get_template_context(self) -> Dict[str, Any]:
         """Get the template context for rendering."""
@@ -219,14 +361,77 @@ class ProjectGenerator:
             "project_name": self.config.project_name,
             "use_db": self.config.use_db,
             "db_type": self.config.db_type,
+            "db_driver": self.config.db_driver,
+            "db_scheme": self.config.db_scheme,
+            "async_db": self.config.use_async_db,
             "use_jwt": self.config.use_jwt,
             "use_logging": self.config.use_logging,
             "use_docker": self.config.use_docker,
+            "use_cache": self.config.use_cache,
+            "use_metrics": self.config.use_metrics,
+            "use_bench": self.config.use_bench,
+            "use_profiling": self.config.use_profiling,
+            "json_library": self.config.json_library,
+            "profile": self.config.profile,
             "python_version": self.config.python_version,
         }
 
-    def _write_file(self, relative_path: str, content: str):
-        """Write content to a file in the project."""
-        file_path = self.config.project_path / relative_path
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(content, encoding="utf-8")
+    def _add_file(self, relative_path: str, content: str):
+        """Plan a file with literal content."""
+        self._plan[relative_path] = PlannedFile(content=content)
+
+    def _render_file(self, relative_path: str, template_name: str, context: Dict[str, Any]):
+        """Plan a file rendered from a template."""
+        self._plan[relative_path] = PlannedFile(template=template_name, context=context)
+
+    def _commit(self, files: Dict[str, str]):
+        """Write rendered files to a staging directory and move it into place."""
+        project_path = self.config.project_path
+        project_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Stage next to the target so the final rename stays on one filesystem
+        staging = project_path.with_name(f".{project_path.name}.staging-{uuid.uuid4().hex[:8]}")
+        staging.mkdir()
+
+        try:
+            # Create every directory once up front, parents before children
+            directories = set(self._directories)
+            directories.update(str(Path(path).parent) for path in files)
+            for directory in sorted(directories):
+                if directory != ".":
+                    (staging / directory).mkdir(parents=True, exist_ok=True)
+
+            def write(item):
+                relative_path, content = item
+                (staging / relative_path).write_text(content, encoding="utf-8")
+
+            with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as pool:
+                # Consume the iterator so write errors are raised here
+                list(pool.map(write, files.items()))
+
+            self._swap_into_place(staging, project_path)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    @staticmethod
+    def _swap_into_place(staging: Path, project_path: Path):
+        """Atomically rename the staging directory to the project path.
+
+        An existing project (``--force``) is first renamed aside and only
+        deleted once the new project is in place; it is restored if the
+        final rename fails.
+        """
+        if not project_path.exists():
+            os.replace(staging, project_path)
+            return
+
+        backup = project_path.with_name(f".{project_path.name}.old-{uuid.uuid4().hex[:8]}")
+        os.replace(project_path, backup)
+        try:
+            os.replace(staging, project_path)
+        except BaseException:
+            os.replace(backup, project_path)
+            raise
+
+        shutil.rmtree(backup, ignore_errors=True)
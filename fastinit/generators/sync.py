@@ -0,0 +1,165 @@
+"""Project synchronizer - re-applies template changes to a generated project."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+import os
+import uuid
+
+from fastinit import __version__
+from fastinit.generators.project import ProjectGenerator
+from fastinit.models.config import ProjectConfig
+from fastinit.models.manifest import (
+    MANIFEST_PATH,
+    FileRecord,
+    ProjectManifest,
+    hash_content,
+    load_manifest,
+)
+
+
+@dataclass
+class SyncResult:
+    """Outcome of synchronizing a project with the current templates."""
+
+    created: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    conflicts: List[str] = field(default_factory=list)  # Edited locally and upstream
+    deleted: List[str] = field(default_factory=list)  # Removed locally, left alone
+    untracked: List[str] = field(default_factory=list)  # No longer generated
+
+    @property
+    def changed(self) -> bool:
+        """Whether any file was (or would be) written."""
+        return bool(self.created or self.updated)
+
+
+class ProjectSynchronizer:
+    """Brings a generated project up to date using its manifest.
+
+    Each file is compared three ways: the content fastinit generated last
+    time (recorded in the manifest), the content on disk and the content the
+    current templates produce. Files are only rewritten when the user has
+    not edited them since they were generated.
+    """
+
+    def __init__(self, project_dir: Path):
+        self.project_dir = project_dir
+
+        manifest = load_manifest(project_dir)
+        if manifest is None:
+            raise ValueError(
+                f"No {MANIFEST_PATH} found in '{project_dir}'. "
+                "Only projects generated by this version of fastinit can be synced."
+            )
+        self.manifest = manifest
+
+        config = ProjectConfig.from_dict(manifest.config, output_dir=project_dir.parent)
+        self.generator = ProjectGenerator(config)
+
+    def sync(self, dry_run: bool = False, force: bool = False) -> SyncResult:
+        """Re-render changed files and write those the user has not modified.
+
+        Args:
+            dry_run: Report what would change without writing anything
+            force: Overwrite files even if they were edited locally
+
+        Returns:
+            Summary of what was (or would be) done to each file
+        """
+        result = SyncResult()
+        records: Dict[str, FileRecord] = {}
+        writes: Dict[str, str] = {}
+
+        for path, planned in self.generator.plan().items():
+            record = self.manifest.files.get(path)
+            inputs = self.generator.fingerprint(planned)
+
+            # Same template source and inputs: the output cannot have changed
+            if record is not None and record.inputs == inputs:
+                records[path] = record
+                result.unchanged.append(path)
+                continue
+
+            content = self.generator.render_file(planned)
+            new_record = FileRecord(
+                sha256=hash_content(content), inputs=inputs, template=planned.template
+            )
+            disk_hash = self._hash_on_disk(path)
+
+            if record is None:
+                if disk_hash is None:
+                    writes[path] = content
+                    result.created.append(path)
+                    records[path] = new_record
+                elif disk_hash == new_record.sha256 or force:
+                    if disk_hash != new_record.sha256:
+                        writes[path] = content
+                        result.updated.append(path)
+                    else:
+                        result.unchanged.append(path)
+                    records[path] = new_record
+                else:
+                    result.conflicts.append(path)
+            elif new_record.sha256 == record.sha256:
+                # Template changed but produces identical output
+                records[path] = new_record
+                result.unchanged.append(path)
+            elif disk_hash == record.sha256 or (force and disk_hash is not None):
+                writes[path] = content
+                result.updated.append(path)
+                records[path] = new_record
+            elif disk_hash == new_record.sha256:
+                # User already applied the same change by hand
+                records[path] = new_record
+                result.unchanged.append(path)
+            elif disk_hash is None:
+                records[path] = record
+                result.deleted.append(path)
+            else:
+                # Keep the old base so the conflict is reported again next time
+                records[path] = record
+                result.conflicts.append(path)
+
+        result.untracked = sorted(set(self.manifest.files) - set(records))
+
+        if dry_run:
+            return result
+
+        for path, content in writes.items():
+            self._write_atomic(path, content)
+
+        if writes or records != self.manifest.files or self._version_changed():
+            manifest = ProjectManifest(
+                fastinit_version=__version__,
+                config=self.manifest.config,
+                files=records,
+            )
+            self._write_atomic(MANIFEST_PATH, manifest.to_json())
+            self.manifest = manifest
+
+        return result
+
+    def _version_changed(self) -> bool:
+        """Whether the manifest was written by a different fastinit version."""
+        return self.manifest.fastinit_version != __version__
+
+    def _hash_on_disk(self, relative_path: str) -> Optional[str]:
+        """Hash a project file as it currently exists, or None if missing."""
+        file_path = self.project_dir / relative_path
+        if not file_path.is_file():
+            return None
+        return hash_content(file_path.read_text(encoding="utf-8"))
+
+    def _write_atomic(self, relative_path: str, content: str):
+        """Replace a single project file without exposing partial writes."""
+        file_path = self.project_dir / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            tmp_path.write_text(content, encoding="utf-8")
+            os.replace(tmp_path, file_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
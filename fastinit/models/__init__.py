@@ -1,5 +1,7 @@
 """Models package."""
 
 from .config import ProjectConfig
+from .manifest import ProjectManifest
+from .spec import BatchSpec, EntitySpec, FieldSpec
 
-__all__ = ["ProjectConfig"]
+__all__ = ["ProjectConfig", "ProjectManifest", "BatchSpec", "EntitySpec", "FieldSpec"]
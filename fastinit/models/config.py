@@ -1,8 +1,25 @@
 """Data models for project configuration."""
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, fields
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
+
+DB_TYPES = ["postgresql", "mysql", "sqlite"]
+DB_DRIVERS = ["sync", "async"]
+# Libraries the default JSON response class can encode with ("std" is FastAPI's JSONResponse)
+JSON_LIBRARIES = ["std", "orjson", "msgspec"]
+# Deployment profiles; "production" adds a tuned server entry point and Docker build
+PROFILES = ["development", "production"]
+
+# SQLAlchemy URL scheme for each (db_type, db_driver) combination
+DB_SCHEMES = {
+    ("postgresql", "sync"): "postgresql+psycopg2",
+    ("postgresql", "async"): "postgresql+asyncpg",
+    ("mysql", "sync"): "mysql+pymysql",
+    ("mysql", "async"): "mysql+aiomysql",
+    ("sqlite", "sync"): "sqlite",
+    ("sqlite", "async"): "sqlite+aiosqlite",
+}
 
 
 @dataclass
@@ -13,9 +30,16 @@ class ProjectConfig:
     output_dir: Path
     use_db: bool = False
     db_type: Optional[str] = None  # postgresql, mysql, sqlite
+    db_driver: str = "sync"  # sync, async
     use_jwt: bool = False
     use_logging: bool = False
     use_docker: bool = False
+    use_cache: bool = False
+    use_metrics: bool = False
+    use_bench: bool = False
+    use_profiling: bool = False
+    json_library: str = "std"  # std, orjson, msgspec
+    profile: str = "development"  # development, production
     python_version: str = "3.11"
 
     @property
@@ -28,5 +52,31 @@ class ProjectConfig:
         """Get the app directory path."""
         return self.project_path / "app"
 
+    @property
+    def use_async_db(self) -> bool:
+        """Whether the project uses the asyncio SQLAlchemy engine."""
+        return self.use_db and self.db_driver == "async"
+
+    @property
+    def db_scheme(self) -> Optional[str]:
+        """Get the SQLAlchemy URL scheme (dialect+driver) for the database."""
+        if not self.use_db or self.db_type is None:
+            return None
+        return DB_SCHEMES[(self.db_type, self.db_driver)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the generation options, without machine-specific paths."""
+        data = asdict(self)
+        data.pop("output_dir")
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], output_dir: Path) -> "ProjectConfig":
+        """Rebuild a config from ``to_dict`` output, ignoring unknown keys."""
+        known = {f.name for f in fields(cls)}
+        options = {key: value for key, value in data.items() if key in known}
+        options["output_dir"] = output_dir
+        return cls(**options)
+
 
-__all__ = ["ProjectConfig"]
+__all__ = ["ProjectConfig", "DB_TYPES", "DB_DRIVERS", "DB_SCHEMES", "JSON_LIBRARIES", "PROFILES"]
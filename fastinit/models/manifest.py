@@ -0,0 +1,73 @@
+"""Manifest of generated project files, used for incremental regeneration."""
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+MANIFEST_PATH = ".fastinit/manifest.json"
+MANIFEST_FORMAT = 1
+
+
+def hash_content(content: str) -> str:
+    """Get the SHA-256 hex digest of a file's text content."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class FileRecord:
+    """What fastinit last generated for a single file."""
+
+    sha256: str  # Hash of the generated content
+    inputs: str  # Hash of the template source and render context
+    template: Optional[str] = None
+
+
+@dataclass
+class ProjectManifest:
+    """Config, version and file hashes recorded when a project is generated."""
+
+    fastinit_version: str
+    config: Dict[str, Any]
+    files: Dict[str, FileRecord] = field(default_factory=dict)
+    format: int = MANIFEST_FORMAT
+
+    def to_json(self) -> str:
+        """Serialize the manifest to stable, diff-friendly JSON."""
+        data = {
+            "format": self.format,
+            "fastinit_version": self.fastinit_version,
+            "config": self.config,
+            "files": {path: asdict(record) for path, record in sorted(self.files.items())},
+        }
+        return json.dumps(data, indent=2, sort_keys=True) + "\n"
+
+    @classmethod
+    def from_json(cls, text: str) -> "ProjectManifest":
+        """Parse a manifest previously written by ``to_json``."""
+        data = json.loads(text)
+        if data.get("format") != MANIFEST_FORMAT:
+            raise ValueError(f"Unsupported manifest format: {data.get('format')!r}")
+        return cls(
+            fastinit_version=data["fastinit_version"],
+            config=data["config"],
+            files={path: FileRecord(**record) for path, record in data["files"].items()},
+        )
+
+
+def load_manifest(project_dir: Path) -> Optional[ProjectManifest]:
+    """Load a project's manifest, or None if the project has none."""
+    manifest_file = project_dir / MANIFEST_PATH
+    if not manifest_file.is_file():
+        return None
+    return ProjectManifest.from_json(manifest_file.read_text(encoding="utf-8"))
+
+
+__all__ = [
+    "MANIFEST_PATH",
+    "FileRecord",
+    "ProjectManifest",
+    "hash_content",
+    "load_manifest",
+]
@@ -0,0 +1,678 @@
+"""Data models for component generation specs."""
+
+import json
+import keyword
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+PAGINATION_TYPES = ["limit-offset", "cursor", "keyset", "none"]
+LAYERS = ["model", "schema", "service", "route"]
+
+# Columns every generated model has, besides the declared fields
+BUILTIN_SORT_COLUMNS = ["id", "created_at"]
+BUILTIN_COLUMNS = ["id", "created_at", "updated_at"]
+# Relationship loader strategies for eager loading, by spec name
+EAGER_LOADERS = {"selectin": "selectinload", "joined": "joinedload"}
+# Field types generated as nullable columns, which keyset pagination cannot seek on
+NULLABLE_FIELD_TYPES = ["text"]
+
+# Field types by spec name, including aliases
+FIELD_TYPES = {
+    "str": "str",
+    "string": "str",
+    "text": "text",
+    "int": "int",
+    "integer": "int",
+    "float": "float",
+    "decimal": "decimal",
+    "bool": "bool",
+    "boolean": "bool",
+    "datetime": "datetime",
+    "date": "date",
+    "enum": "enum",
+    "json": "json",
+    "fk": "fk",
+}
+# Field modifiers, given after the type, e.g. 'email:str(320):unique:index'
+FIELD_MODIFIERS = ["unique", "index", "nullable"]
+# Field types that cannot be indexed portably (MySQL needs a prefix length)
+UNINDEXABLE_FIELD_TYPES = ["text", "json"]
+
+DEFAULT_STRING_LENGTH = 255
+DEFAULT_DECIMAL = (10, 2)
+
+# List endpoint filter operators, with the field types each applies to
+FILTER_OPERATORS = {
+    "eq": ["str", "int", "fk", "float", "decimal", "bool", "datetime", "date", "enum"],
+    "in": ["str", "int", "fk", "enum"],
+    "range": ["int", "fk", "float", "decimal", "datetime", "date"],
+    "prefix": ["str"],
+}
+# Pagination types whose order a client may choose; the others order by their cursor
+SORTABLE_PAGINATION_TYPES = ["limit-offset", "none"]
+# List total strategies: always COUNT(*), or planner estimates for large tables
+COUNT_STRATEGIES = ["exact", "estimate"]
+# Pagination types that return part of a list, so a total tells clients something
+COUNTED_PAGINATION_TYPES = ["limit-offset", "cursor", "keyset"]
+
+_TYPE_PATTERN = re.compile(r"^(\w+)\s*(?:\((.*)\))?$")
+_CHOICE_PATTERN = re.compile(r"^[\w.-]+$")
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """A validated model field, parsed from a spec like 'price:decimal(12,2)'.
+
+    Shared by the model, schema and service templates: ``column_type`` and
+    ``sqlalchemy_types`` describe the column, ``python_type`` and
+    ``constraints`` the Pydantic field.
+    """
+
+    name: str
+    type: str
+    length: Optional[int] = None
+    precision: Optional[int] = None
+    scale: Optional[int] = None
+    choices: Tuple[str, ...] = ()
+    references: Optional[str] = None
+    unique: bool = False
+    index: bool = False
+    nullable: bool = False
+
+    @classmethod
+    def parse(cls, name: str, spec: str) -> "FieldSpec":
+        """Parse the part of a field spec after the name, e.g. 'str(320):unique'."""
+        name = name.strip()
+        if not name.isidentifier() or keyword.iskeyword(name):
+            raise ValueError(f"Invalid field name '{name}'")
+        if name in BUILTIN_COLUMNS:
+            raise ValueError(f"Field '{name}' is added to every model and cannot be declared")
+
+        type_part, *modifiers = [part.strip() for part in spec.split(":")]
+        match = _TYPE_PATTERN.match(type_part)
+        if not match or match.group(1).lower() not in FIELD_TYPES:
+            raise ValueError(
+                f"Invalid type '{type_part}' for field '{name}'. "
+                f"Must be one of: {', '.join(FIELD_TYPES)}"
+            )
+        field_type = FIELD_TYPES[match.group(1).lower()]
+        args = match.group(2)
+        options: Dict[str, Any] = {"nullable": field_type in NULLABLE_FIELD_TYPES}
+
+        if field_type == "str":
+            if args is not None:
+                options["length"] = _positive_int(args, name)
+        elif field_type == "decimal":
+            precision, scale = DEFAULT_DECIMAL
+            if args is not None:
+                values = [value.strip() for value in args.split(",")]
+                if len(values) != 2:
+                    raise ValueError(f"Field '{name}' expects decimal(precision,scale)")
+                precision = _positive_int(values[0], name)
+                scale = _positive_int(values[1], name, minimum=0)
+                if scale > precision:
+                    raise ValueError(f"Field '{name}' has a scale larger than its precision")
+            options.update(precision=precision, scale=scale)
+        elif field_type == "enum":
+            choices = tuple(choice.strip() for choice in (args or "").split(","))
+            if not all(choices):
+                raise ValueError(f"Field '{name}' expects enum(choice,choice,...)")
+            for choice in choices:
+                if not _CHOICE_PATTERN.match(choice):
+                    raise ValueError(f"Invalid choice '{choice}' for field '{name}'")
+            if len(set(choices)) != len(choices):
+                raise ValueError(f"Field '{name}' lists a choice more than once")
+            options["choices"] = choices
+        elif field_type == "fk":
+            table, _, column = (args or "").strip().partition(".")
+            if not (table.isidentifier() and column.isidentifier()):
+                raise ValueError(f"Field '{name}' expects fk(table.column)")
+            options["references"] = f"{table}.{column}"
+        elif args is not None:
+            raise ValueError(f"Type '{field_type}' of field '{name}' takes no arguments")
+
+        for modifier in modifiers:
+            if modifier not in FIELD_MODIFIERS:
+                raise ValueError(
+                    f"Invalid modifier '{modifier}' for field '{name}'. "
+                    f"Must be one of: {', '.join(FIELD_MODIFIERS)}"
+                )
+            options[modifier] = True
+
+        indexed = options.get("unique") or options.get("index")
+        if field_type in UNINDEXABLE_FIELD_TYPES and indexed:
+            hint = " (use str(length) instead)" if field_type == "text" else ""
+            raise ValueError(f"Field '{name}' of type {field_type} cannot be indexed{hint}")
+
+        return cls(name=name, type=field_type, **options)
+
+    @property
+    def indexed(self) -> bool:
+        """Whether the column gets an index of its own.
+
+        Foreign keys are always indexed: most databases do not index them
+        implicitly, so joins and deletes of the parent would scan this table.
+        """
+        return self.index or self.type == "fk"
+
+    @property
+    def column_type(self) -> str:
+        """The SQLAlchemy column type, e.g. ``String(320)``."""
+        if self.type == "str":
+            return f"String({self.length or DEFAULT_STRING_LENGTH})"
+        if self.type == "decimal":
+            return f"Numeric({self.precision}, {self.scale})"
+        if self.type == "enum":
+            choices = ", ".join(f'"{choice}"' for choice in self.choices)
+            # Stored as VARCHAR, so adding a choice needs no type migration
+            return f"Enum({choices}, native_enum=False)"
+        return {
+            "text": "Text",
+            "int": "Integer",
+            "fk": "Integer",
+            "float": "Float",
+            "bool": "Boolean",
+            "datetime": "DateTime(timezone=True)",
+            "date": "Date",
+            "json": "JSON",
+        }[self.type]
+
+    @property
+    def sqlalchemy_types(self) -> List[str]:
+        """Names the model module imports from ``sqlalchemy`` for this column."""
+        names = [self.column_type.split("(")[0]]
+        if self.references:
+            names.append("ForeignKey")
+        return names
+
+    @property
+    def python_type(self) -> str:
+        """The annotation of the field in Pydantic schemas."""
+        if self.type == "enum":
+            return "Literal[" + ", ".join(f'"{choice}"' for choice in self.choices) + "]"
+        return {
+            "str": "str",
+            "text": "str",
+            "int": "int",
+            "fk": "int",
+            "float": "float",
+            "decimal": "Decimal",
+            "bool": "bool",
+            "datetime": "datetime",
+            "date": "date",
+            "json": "Any",
+        }[self.type]
+
+    @property
+    def constraints(self) -> str:
+        """Keyword arguments for ``pydantic.Field`` matching the column's limits."""
+        if self.type == "str":
+            return f"max_length={self.length or DEFAULT_STRING_LENGTH}"
+        if self.type == "decimal":
+            return f"max_digits={self.precision}, decimal_places={self.scale}"
+        return ""
+
+
+def _positive_int(value: str, field_name: str, minimum: int = 1) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = minimum - 1
+    if number < minimum:
+        raise ValueError(f"Invalid size '{value}' for field '{field_name}'")
+    return number
+
+
+def _split_top_level(text: str) -> List[str]:
+    """Split on commas that are not inside parentheses."""
+    items, depth, current = [], 0, []
+    for char in text:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        if char == "," and depth == 0:
+            items.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    items.append("".join(current))
+    return items
+
+
+def parse_fields(text: str) -> Dict[str, FieldSpec]:
+    """Parse a field string like 'name:str,email:str(320):unique,price:decimal(12,2)'.
+
+    Each field is ``name:type``, with arguments for some types and any
+    modifiers after the type: ``str(length)``, ``decimal(precision,scale)``,
+    ``enum(a,b,c)``, ``fk(table.column)``, then ``:unique``, ``:index`` or
+    ``:nullable``.
+    """
+    fields: Dict[str, FieldSpec] = {}
+    for item in _split_top_level(text):
+        if not item.strip():
+            continue
+        if ":" not in item:
+            raise ValueError(f"Invalid field '{item.strip()}': expected 'name:type'")
+        field_name, field_type = item.split(":", 1)
+        spec = FieldSpec.parse(field_name, field_type)
+        if spec.name in fields:
+            raise ValueError(f"Field '{spec.name}' is listed more than once")
+        fields[spec.name] = spec
+    return fields
+
+
+def parse_index(value: Union[str, Sequence[str]], fields: Dict[str, FieldSpec]) -> List[str]:
+    """Parse the columns of a composite index or unique constraint, e.g. 'owner_id,name'.
+
+    Columns must be declared fields or built-in columns, and indexable.
+    """
+    items = value.split(",") if isinstance(value, str) else list(value)
+    columns = [item.strip() for item in items if item.strip()]
+    if not columns:
+        raise ValueError("An index must name at least one column")
+    for column in columns:
+        if column in BUILTIN_COLUMNS:
+            continue
+        if column not in fields:
+            raise ValueError(
+                f"Unknown index column '{column}'. "
+                f"Must be a field or one of: {', '.join(BUILTIN_COLUMNS)}"
+            )
+        if fields[column].type in UNINDEXABLE_FIELD_TYPES:
+            raise ValueError(f"Column '{column}' of type {fields[column].type} cannot be indexed")
+    if len(set(columns)) != len(columns):
+        raise ValueError(f"Index '{','.join(columns)}' lists a column more than once")
+    return columns
+
+
+def column_fields(fields: Dict[str, FieldSpec]) -> Dict[str, FieldSpec]:
+    """Get the declared fields plus the columns every generated model has."""
+    return {
+        "id": FieldSpec("id", "int", index=True),
+        "created_at": FieldSpec("created_at", "datetime"),
+        "updated_at": FieldSpec("updated_at", "datetime", nullable=True),
+        **fields,
+    }
+
+
+def indexed_columns(
+    fields: Dict[str, FieldSpec],
+    index_columns: Sequence[str] = (),
+    indexes: Sequence[Sequence[str]] = (),
+    unique: Sequence[Sequence[str]] = (),
+) -> List[str]:
+    """Get the columns that lead an index of the model, so lookups by them can seek."""
+    columns = ["id"] + [name for name, spec in fields.items() if spec.indexed or spec.unique]
+    for index in [index_columns, *indexes, *unique]:
+        if index and index[0] not in columns:
+            columns.append(index[0])
+    return columns
+
+
+def _require_index(column: str, indexed: Sequence[str], usage: str) -> None:
+    if column not in indexed:
+        raise ValueError(
+            f"{usage} column '{column}' is not indexed. Add ':index' to the field "
+            "or declare a composite index that starts with it"
+        )
+
+
+def parse_filters(
+    value: Union[str, Sequence[str], Dict[str, Any]],
+    fields: Dict[str, FieldSpec],
+    indexed: Sequence[str],
+) -> Dict[str, List[str]]:
+    """Parse list endpoint filters like 'status:eq:in,price:range,name:prefix'.
+
+    Each entry is a column with its operators ('eq' if none are given):
+    ``eq``, ``in``, ``range`` (inclusive bounds) and ``prefix``. Only
+    columns in ``indexed`` are accepted, so no filter scans the table.
+    A mapping of column to operators is accepted too.
+    """
+    if isinstance(value, dict):
+        value = [
+            ":".join([name, *(ops.split(",") if isinstance(ops, str) else ops or [])])
+            for name, ops in value.items()
+        ]
+    items = value.split(",") if isinstance(value, str) else list(value)
+    columns = column_fields(fields)
+    filters: Dict[str, List[str]] = {}
+    for item in items:
+        if not item.strip():
+            continue
+        column, *operators = [part.strip() for part in item.split(":")]
+        if column not in columns:
+            raise ValueError(
+                f"Unknown filter column '{column}'. "
+                f"Must be a field or one of: {', '.join(BUILTIN_COLUMNS)}"
+            )
+        for operator in operators or ["eq"]:
+            if operator not in FILTER_OPERATORS:
+                raise ValueError(
+                    f"Invalid filter '{operator}' for '{column}'. "
+                    f"Must be one of: {', '.join(FILTER_OPERATORS)}"
+                )
+            if columns[column].type not in FILTER_OPERATORS[operator]:
+                raise ValueError(
+                    f"Filter '{operator}' does not apply to '{column}' "
+                    f"of type {columns[column].type}"
+                )
+            if operator not in filters.setdefault(column, []):
+                filters[column].append(operator)
+        _require_index(column, indexed, "Filter")
+    return filters
+
+
+def parse_sortable(
+    value: Union[str, Sequence[str]], fields: Dict[str, FieldSpec], indexed: Sequence[str]
+) -> List[str]:
+    """Parse the columns clients may sort a list endpoint by, e.g. 'price,created_at'.
+
+    Only columns in ``indexed`` are accepted, so sorting never needs a
+    full sort of the table.
+    """
+    items = value.split(",") if isinstance(value, str) else list(value)
+    columns = column_fields(fields)
+    sortable: List[str] = []
+    for item in items:
+        column = item.strip()
+        if not column or column in sortable:
+            continue
+        if column not in columns:
+            raise ValueError(
+                f"Unknown sort column '{column}'. "
+                f"Must be a field or one of: {', '.join(BUILTIN_COLUMNS)}"
+            )
+        _require_index(column, indexed, "Sort")
+        sortable.append(column)
+    return sortable
+
+
+def parse_sort(value: Union[str, Sequence[str]]) -> List[str]:
+    """Parse a keyset sort order like '-created_at,-id' into a list of sort keys.
+
+    A leading '-' sorts descending. All keys must share one direction, and
+    'id' is appended as a tie-breaker so every row has a unique position.
+    """
+    items = value.split(",") if isinstance(value, str) else list(value)
+    keys = [item.strip() for item in items if item.strip()]
+    if not keys:
+        raise ValueError("Sort order must name at least one column")
+
+    descending = keys[0].startswith("-")
+    columns = []
+    for key in keys:
+        if key.startswith("-") != descending:
+            raise ValueError(
+                f"Invalid sort order '{','.join(keys)}': "
+                "all columns must sort in the same direction"
+            )
+        column = key.lstrip("-")
+        if not column.isidentifier():
+            raise ValueError(f"Invalid sort column '{column}'")
+        if column in columns:
+            raise ValueError(f"Sort column '{column}' is listed more than once")
+        columns.append(column)
+
+    if "id" not in columns:
+        columns.append("id")
+    prefix = "-" if descending else ""
+    return [f"{prefix}{column}" for column in columns]
+
+
+def keyset_index_columns(pagination_type: str, sort: Optional[Sequence[str]]) -> List[str]:
+    """Get the columns of the index a keyset sort order needs, if any.
+
+    Sorting by ``id`` alone is served by the primary key.
+    """
+    if pagination_type != "keyset":
+        return []
+    columns = [key.lstrip("-") for key in parse_sort(sort or ["id"])]
+    return columns if columns != ["id"] else []
+
+
+def validate_sort(sort: Sequence[str], fields: Dict[str, FieldSpec]) -> None:
+    """Check that every sort column exists on the model and is never NULL."""
+    for key in sort:
+        column = key.lstrip("-")
+        if column in BUILTIN_SORT_COLUMNS:
+            continue
+        if column not in fields:
+            raise ValueError(
+                f"Unknown sort column '{column}'. "
+                f"Must be a field or one of: {', '.join(BUILTIN_SORT_COLUMNS)}"
+            )
+        if fields[column].nullable:
+            raise ValueError(
+                f"Sort column '{column}' is nullable and cannot be used for keyset pagination"
+            )
+        if fields[column].type in UNINDEXABLE_FIELD_TYPES:
+            raise ValueError(
+                f"Sort column '{column}' of type {fields[column].type} "
+                "cannot be used for keyset pagination"
+            )
+
+
+def validate_count(strategy: str, pagination: str) -> None:
+    """Check that a list total strategy exists and applies to the pagination type."""
+    if strategy not in COUNT_STRATEGIES:
+        raise ValueError(
+            f"Invalid count strategy '{strategy}'. Must be one of: {', '.join(COUNT_STRATEGIES)}"
+        )
+    if pagination not in COUNTED_PAGINATION_TYPES:
+        raise ValueError(
+            f"{pagination} pagination returns every row, so it has no total to count; "
+            f"counts need one of: {', '.join(COUNTED_PAGINATION_TYPES)}"
+        )
+
+
+def parse_eager(value: Union[str, Sequence[str]]) -> List[str]:
+    """Parse eager-loaded relationships like 'tags,owner:joined'.
+
+    Each entry is a relationship name with an optional loader strategy
+    ('selectin' by default, or 'joined'). Returns 'name:strategy' entries.
+    """
+    items = value.split(",") if isinstance(value, str) else list(value)
+    eager = []
+    for item in items:
+        if not item.strip():
+            continue
+        relationship, _, strategy = item.strip().partition(":")
+        strategy = strategy or "selectin"
+        if not relationship.isidentifier():
+            raise ValueError(f"Invalid relationship name '{relationship}'")
+        if strategy not in EAGER_LOADERS:
+            raise ValueError(
+                f"Invalid loader '{strategy}' for '{relationship}'. "
+                f"Must be one of: {', '.join(EAGER_LOADERS)}"
+            )
+        eager.append(f"{relationship}:{strategy}")
+    return eager
+
+
+@dataclass
+class EntitySpec:
+    """Specification of a single entity to scaffold."""
+
+    name: str
+    fields: Dict[str, FieldSpec] = field(default_factory=dict)
+    pagination: str = "limit-offset"
+    layers: List[str] = field(default_factory=lambda: list(LAYERS))
+    sort: List[str] = field(default_factory=lambda: ["id"])
+    bulk: bool = False
+    eager: List[str] = field(default_factory=list)
+    cache: bool = False
+    dump_json: bool = False
+    export: bool = False
+    sparse: bool = False
+    core_reads: bool = False
+    count: Optional[str] = None
+    indexes: List[List[str]] = field(default_factory=list)
+    unique: List[List[str]] = field(default_factory=list)
+    filters: Dict[str, List[str]] = field(default_factory=dict)
+    sortable: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        if not self.name or not self.name.isidentifier():
+            raise ValueError(f"Invalid entity name '{self.name}'")
+        self.fields = _coerce_fields(self.fields)
+        if self.pagination not in PAGINATION_TYPES:
+            raise ValueError(
+                f"Invalid pagination type '{self.pagination}' for '{self.name}'. "
+                f"Must be one of: {', '.join(PAGINATION_TYPES)}"
+            )
+        unknown = [layer for layer in self.layers if layer not in LAYERS]
+        if unknown:
+            raise ValueError(
+                f"Invalid layer(s) {', '.join(unknown)} for '{self.name}'. "
+                f"Must be among: {', '.join(LAYERS)}"
+            )
+        self.sort = parse_sort(self.sort)
+        validate_sort(self.sort, self.fields)
+        self.eager = parse_eager(self.eager)
+        self.indexes = [parse_index(index, self.fields) for index in self.indexes]
+        self.unique = [parse_index(columns, self.fields) for columns in self.unique]
+        indexed = indexed_columns(
+            self.fields,
+            keyset_index_columns(self.pagination, self.sort),
+            self.indexes,
+            self.unique,
+        )
+        self.filters = parse_filters(self.filters, self.fields, indexed)
+        self.sortable = parse_sortable(self.sortable, self.fields, indexed)
+        if self.sortable and self.pagination not in SORTABLE_PAGINATION_TYPES:
+            raise ValueError(
+                f"'{self.name}' uses {self.pagination} pagination, which fixes the order; "
+                f"sortable columns need one of: {', '.join(SORTABLE_PAGINATION_TYPES)}"
+            )
+        if self.count is not None:
+            validate_count(self.count, self.pagination)
+
+
+@dataclass
+class BatchSpec:
+    """A collection of entities to scaffold in one run."""
+
+    entities: List[EntitySpec] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BatchSpec":
+        """Build a spec from parsed YAML/TOML/JSON data.
+
+        Entities may be given as a list of tables or as a mapping of entity
+        name to table. Keys under ``defaults`` apply to every entity.
+        """
+        if not isinstance(data, dict) or "entities" not in data:
+            raise ValueError("Spec must contain an 'entities' list or mapping")
+
+        defaults = data.get("defaults") or {}
+        raw_entities = data["entities"]
+        if isinstance(raw_entities, dict):
+            raw_entities = [dict(body or {}, name=name) for name, body in raw_entities.items()]
+
+        entities = []
+        seen = set()
+        for raw in raw_entities:
+            merged = {**defaults, **raw}
+            name = str(merged.get("name", ""))
+            if name.lower() in seen:
+                raise ValueError(f"Entity '{name}' is defined more than once")
+            seen.add(name.lower())
+
+            entities.append(
+                EntitySpec(
+                    name=name,
+                    fields=merged.get("fields") or {},
+                    pagination=merged.get("pagination", "limit-offset"),
+                    layers=list(merged.get("layers", LAYERS)),
+                    sort=merged.get("sort", ["id"]),
+                    bulk=bool(merged.get("bulk", False)),
+                    eager=merged.get("eager", []),
+                    cache=bool(merged.get("cache", False)),
+                    dump_json=bool(merged.get("dump_json", False)),
+                    export=bool(merged.get("export", False)),
+                    sparse=bool(merged.get("sparse", False)),
+                    core_reads=bool(merged.get("core_reads", False)),
+                    count=merged.get("count"),
+                    indexes=list(merged.get("indexes", [])),
+                    unique=list(merged.get("unique", [])),
+                    filters=merged.get("filters") or {},
+                    sortable=merged.get("sortable") or [],
+                )
+            )
+
+        return cls(entities=entities)
+
+
+def _coerce_fields(value: Union[None, str, Dict[str, Any]]) -> Dict[str, FieldSpec]:
+    """Accept fields as a 'name:type' string or as a mapping of name to type spec."""
+    if not value:
+        return {}
+    if isinstance(value, str):
+        return parse_fields(value)
+    if isinstance(value, dict):
+        return {
+            str(name): (
+                spec if isinstance(spec, FieldSpec) else FieldSpec.parse(str(name), str(spec))
+            )
+            for name, spec in value.items()
+        }
+    raise ValueError(f"Invalid fields definition: {value!r}")
+
+
+def load_batch_spec(path: Path) -> BatchSpec:
+    """Load a batch spec from a .yaml/.yml, .toml or .json file."""
+    suffix = path.suffix.lower()
+    text = path.read_text(encoding="utf-8")
+
+    if suffix in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError(
+                "Reading YAML specs requires PyYAML: pip install 'fastinit[yaml]'"
+            ) from None
+        data = yaml.safe_load(text)
+    elif suffix == ".toml":
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ValueError(
+                    "Reading TOML specs on Python < 3.11 requires tomli: "
+                    "pip install 'fastinit[toml]'"
+                ) from None
+        data = tomllib.loads(text)
+    elif suffix == ".json":
+        data = json.loads(text)
+    else:
+        raise ValueError(f"Unsupported spec format '{suffix}' (use .yaml, .toml or .json)")
+
+    return BatchSpec.from_dict(data)
+
+
+__all__ = [
+    "PAGINATION_TYPES",
+    "LAYERS",
+    "EAGER_LOADERS",
+    "FIELD_TYPES",
+    "FieldSpec",
+    "EntitySpec",
+    "BatchSpec",
+    "parse_fields",
+    "parse_index",
+    "parse_filters",
+    "parse_sortable",
+    "indexed_columns",
+    "keyset_index_columns",
+    "parse_sort",
+    "parse_eager",
+    "validate_sort",
+    "validate_count",
+    "load_batch_spec",
+]
@@ -1,7 +1,23 @@
 """Template rendering utilities."""
 
-from typing import Dict, Any
-from jinja2 import Environment, PackageLoader, select_autoescape
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Optional
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    select_autoescape,
+)
+
+from fastinit import __version__
+
+# Set FASTINIT_TEMPLATE_CACHE to a directory to relocate the compiled template
+# cache, or to "0"/"off" to disable it entirely.
+CACHE_ENV_VAR = "FASTINIT_TEMPLATE_CACHE"
 
 
 class TemplateRenderer:
@@ -9,23 +25,20 @@ class TemplateRenderer:
 
     def __init__(self):
         """Initialize the template renderer."""
-        self.env = Environment(
-            loader=PackageLoader("fastinit", "templates"),
-            autoescape=select_autoescape(),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-
-        # Add custom filters
-        self.env.filters["snake_case"] = self._snake_case
-        self.env.filters["pascal_case"] = self._pascal_case
-        self.env.filters["kebab_case"] = self._kebab_case
+        # All renderers in a process share one environment, so every template
+        # is loaded (and compiled, if the bytecode cache misses) at most once.
+        self.env = get_environment()
 
     def render(self, template_name: str, context: Dict[str, Any]) -> str:
         """Render a template with the given context."""
         template = self.env.get_template(template_name)
         return template.render(**context)
 
+    def get_source(self, template_name: str) -> str:
+        """Get the source text of a template without compiling it."""
+        source, _, _ = self.env.loader.get_source(self.env, template_name)
+        return source
+
     @staticmethod
     def _snake_case(text: str) -> str:
         """Convert text to snake_case."""
@@ -50,3 +63,78 @@ class TemplateRenderer:
         text = re.sub("(.)([A-Z][a-z]+)", r"\1-\2", text)
         text = re.sub("([a-z0-9])([A-Z])", r"\1-\2", text)
         return text.lower().replace("_", "-")
+
+
+def get_cache_dir() -> Optional[Path]:
+    """Get the directory holding compiled templates, or None if disabled.
+
+    The directory is namespaced by fastinit version and interpreter cache tag,
+    and every entry is additionally checked against the template source hash,
+    so upgrades and template edits never load stale bytecode.
+    """
+    override = os.environ.get(CACHE_ENV_VAR)
+    if override is not None and override.lower() in ("", "0", "off", "false", "no"):
+        return None
+
+    if override:
+        base = Path(override)
+    elif os.name == "nt":
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home())) / "fastinit" / "cache"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "fastinit"
+
+    return base / f"templates-{__version__}-{sys.implementation.cache_tag}"
+
+
+def _make_bytecode_cache() -> Optional[BytecodeCache]:
+    """Create the on-disk bytecode cache, falling back to none if unwritable."""
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+
+    if not os.access(cache_dir, os.W_OK):
+        return None
+
+    return FileSystemBytecodeCache(str(cache_dir), pattern="%s.jinjac")
+
+
+@lru_cache(maxsize=None)
+def get_environment() -> Environment:
+    """Get the process-wide Jinja2 environment used by all renderers."""
+    env = Environment(
+        loader=PackageLoader("fastinit", "templates"),
+        autoescape=select_autoescape(),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=_make_bytecode_cache(),
+        auto_reload=False,
+        cache_size=-1,
+    )
+
+    # Add custom filters
+    env.filters["snake_case"] = TemplateRenderer._snake_case
+    env.filters["pascal_case"] = TemplateRenderer._pascal_case
+    env.filters["kebab_case"] = TemplateRenderer._kebab_case
+
+    return env
+
+
+def precompile_templates() -> int:
+    """Load every packaged template so its bytecode is written to the cache.
+
+    Returns:
+        Number of templates loaded
+    """
+    env = get_environment()
+    names = env.list_templates(filter_func=lambda name: name.endswith(".jinja"))
+    for name in names:
+        env.get_template(name)
+    return len(names)
+
+
+__all__ = ["TemplateRenderer", "get_environment", "get_cache_dir", "precompile_templates"]
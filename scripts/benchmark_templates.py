@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Benchmark template compilation for a fully-featured project.
+
+Generates a project with --db --jwt --logging --docker twice per round: once
+with the template bytecode cache disabled (every template is lexed, parsed
+and compiled from source) and once against a warm cache. Reports the time
+spent loading templates and the total generation time for each mode.
+
+Usage:
+    python scripts/benchmark_templates.py [--rounds N]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from fastinit import templates
+from fastinit.generators.project import ProjectGenerator
+from fastinit.models.config import ProjectConfig
+
+
+def run_once(output_dir: Path, cache_setting: str):
+    """Generate one project with a fresh environment and return timings."""
+    os.environ[templates.CACHE_ENV_VAR] = cache_setting
+    templates.get_environment.cache_clear()
+
+    env = templates.get_environment()
+    original_get_template = env.get_template
+    load_time = 0.0
+
+    def timed_get_template(*args, **kwargs):
+        nonlocal load_time
+        start = time.perf_counter()
+        try:
+            return original_get_template(*args, **kwargs)
+        finally:
+            load_time += time.perf_counter() - start
+
+    env.get_template = timed_get_template
+
+    config = ProjectConfig(
+        project_name="bench-project",
+        output_dir=output_dir,
+        use_db=True,
+        db_type="postgresql",
+        use_jwt=True,
+        use_logging=True,
+        use_docker=True,
+    )
+
+    start = time.perf_counter()
+    ProjectGenerator(config).generate()
+    total_time = time.perf_counter() - start
+
+    return load_time, total_time
+
+
+def main():
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=20, help="Rounds per mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        cache_dir = str(tmp_path / "cache")
+        results = {"no cache": [], "bytecode cache": []}
+
+        # Populate the cache once so the warm runs measure loading only
+        run_once(tmp_path / "warmup", cache_dir)
+
+        for i in range(args.rounds):
+            results["no cache"].append(run_once(tmp_path / f"cold-{i}", "off"))
+            results["bytecode cache"].append(run_once(tmp_path / f"warm-{i}", cache_dir))
+
+    print(f"Template set: --db --jwt --logging --docker ({args.rounds} rounds, median)")
+    print(f"{'mode':<16}{'template load':>16}{'generate total':>18}")
+    for mode, samples in results.items():
+        load = statistics.median(s[0] for s in samples) * 1000
+        total = statistics.median(s[1] for s in samples) * 1000
+        print(f"{mode:<16}{load:>13.2f} ms{total:>15.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
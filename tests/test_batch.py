@@ -0,0 +1,139 @@
+"""Tests for batch scaffolding from a spec file."""
+
+import json
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from fastinit.cli import app
+from fastinit.models.spec import BatchSpec, load_batch_spec
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def test_project(tmp_path):
+    """Create a test FastAPI project."""
+    project_name = "test-batch-project"
+    result = runner.invoke(app, ["init", project_name, "--output", str(tmp_path), "--db"])
+    assert result.exit_code == 0
+    return tmp_path / project_name
+
+
+def test_batch_from_json(test_project, tmp_path):
+    """Test generating several entities from a JSON spec."""
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(
+        json.dumps(
+            {
+                "defaults": {"pagination": "cursor"},
+                "entities": [
+                    {"name": "Product", "fields": "name:str,price:float"},
+                    {
+                        "name": "OrderItem",
+                        "fields": {"quantity": "int"},
+                        "pagination": "none",
+                        "cache": True,
+                    },
+                    {"name": "Tag", "fields": {"name": "str"}, "layers": ["model", "schema"]},
+                ],
+            }
+        )
+    )
+
+    result = runner.invoke(
+        app, ["new", "batch", str(spec_file), "--project-dir", str(test_project)]
+    )
+    assert result.exit_code == 0
+    assert "3 entities generated" in result.stdout
+
+    app_dir = test_project / "app"
+    assert (app_dir / "models" / "product.py").is_file()
+    assert (app_dir / "api" / "routes" / "products.py").is_file()
+    assert "filter(Product.id > cursor)" in (
+        app_dir / "services" / "product_service.py"
+    ).read_text()
+
+    route_content = (app_dir / "api" / "routes" / "orderitems.py").read_text()
+    assert "OrderItemCreate" in route_content
+    assert "cursor" not in route_content
+    assert "cached_response(request, body)" in route_content
+    assert (test_project / "tests" / "test_orderitems_cache.py").is_file()
+    assert "CACHE" not in (app_dir / "services" / "product_service.py").read_text()
+
+    assert (app_dir / "schemas" / "tag.py").is_file()
+    assert not (app_dir / "services" / "tag_service.py").exists()
+    assert not (app_dir / "api" / "routes" / "tags.py").exists()
+
+
+def test_batch_from_yaml(test_project, tmp_path):
+    """Test generating entities from a YAML spec."""
+    pytest.importorskip("yaml")
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(
+        "entities:\n"
+        "  Customer:\n"
+        "    fields:\n"
+        "      name: str\n"
+        "      email: str\n"
+    )
+
+    result = runner.invoke(
+        app, ["new", "batch", str(spec_file), "--project-dir", str(test_project)]
+    )
+    assert result.exit_code == 0
+    assert "email: str" in (test_project / "app" / "schemas" / "customer.py").read_text()
+
+
+def test_batch_refuses_existing_files(test_project, tmp_path):
+    """Test that nothing is written when any target file already exists."""
+    result = runner.invoke(app, ["new", "crud", "Product", "--project-dir", str(test_project)])
+    assert result.exit_code == 0
+
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(json.dumps({"entities": [{"name": "Order"}, {"name": "Product"}]}))
+
+    result = runner.invoke(
+        app, ["new", "batch", str(spec_file), "--project-dir", str(test_project)]
+    )
+    assert result.exit_code == 1
+    assert "already exist" in result.stdout
+    assert not (test_project / "app" / "models" / "order.py").exists()
+
+
+def test_batch_spec_validation(tmp_path):
+    """Test that invalid specs are rejected before generation."""
+    with pytest.raises(ValueError, match="Invalid pagination type"):
+        BatchSpec.from_dict({"entities": [{"name": "Product", "pagination": "pages"}]})
+
+    with pytest.raises(ValueError, match="Invalid layer"):
+        BatchSpec.from_dict({"entities": [{"name": "Product", "layers": ["views"]}]})
+
+    with pytest.raises(ValueError, match="more than once"):
+        BatchSpec.from_dict({"entities": [{"name": "Product"}, {"name": "product"}]})
+
+    spec_file = tmp_path / "spec.ini"
+    spec_file.write_text("")
+    with pytest.raises(ValueError, match="Unsupported spec format"):
+        load_batch_spec(spec_file)
+
+
+def test_batch_large_spec_is_fast(test_project, tmp_path):
+    """Test that a 200-entity spec is generated in a single fast pass."""
+    spec_file = tmp_path / "spec.json"
+    entities = [
+        {"name": f"Entity{i}", "fields": "name:str,count:int,price:float,notes:text"}
+        for i in range(200)
+    ]
+    spec_file.write_text(json.dumps({"entities": entities}))
+
+    started = time.perf_counter()
+    result = runner.invoke(
+        app, ["new", "batch", str(spec_file), "--project-dir", str(test_project)]
+    )
+    elapsed = time.perf_counter() - started
+
+    assert result.exit_code == 0
+    assert len(list((test_project / "app" / "models").glob("entity*.py"))) == 200
+    assert elapsed < 2.0
@@ -1,11 +1,48 @@
 """Tests for the fastinit CLI."""
 
+import os
+import re
+import subprocess
+import sys
+
 from typer.testing import CliRunner
 
 from fastinit.cli import app
 
 runner = CliRunner()
 
+# Generous ceiling for all imports of a cold `fastinit` start under -X importtime
+STARTUP_BUDGET_MS = 400
+
+# Modules that only the generating subcommands need
+HEAVY_MODULES = ("jinja2", "fastinit.generators", "fastinit.templates", "rich.progress")
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def _run_importtime(args, extra_env=None):
+    """Run the CLI under -X importtime and return (top-level ms, imported modules)."""
+    env = dict(os.environ, **(extra_env or {}))
+    script = "from fastinit.cli import app; app(args={!r}, prog_name='fastinit')".format(args)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            cumulative, indent, module = match.groups()
+            modules.add(module)
+            if not indent:
+                total_us += int(cumulative)
+
+    return result, total_us / 1000, modules
+
 
 def test_version():
     """Test version command."""
@@ -14,6 +51,41 @@ def test_version():
     assert "FastInit" in result.stdout
 
 
+def test_version_startup_budget():
+    """Test that `fastinit version` does not import the generator stack."""
+    result, total_ms, modules = _run_importtime(["version"])
+
+    assert result.returncode == 0
+    assert "fastinit.cli" in modules
+    assert not [m for m in modules if m.startswith(HEAVY_MODULES)]
+    assert total_ms < STARTUP_BUDGET_MS
+
+
+def test_completion_startup_budget():
+    """Test that shell completion stays within the startup budget."""
+    result, total_ms, modules = _run_importtime(
+        [],
+        {
+            "_FASTINIT_COMPLETE": "complete_bash",
+            "COMP_WORDS": "fastinit new ",
+            "COMP_CWORD": "2",
+        },
+    )
+
+    assert "crud" in result.stdout.split()
+    assert not [m for m in modules if m.startswith(HEAVY_MODULES)]
+    assert total_ms < STARTUP_BUDGET_MS
+
+
+def test_help_lists_lazy_commands():
+    """Test that lazily loaded commands appear in the top-level help."""
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert "init" in result.stdout
+    assert "new" in result.stdout
+    assert "Initialize a new FastAPI project" in result.stdout
+
+
 def test_init_basic(tmp_path):
     """Test basic project initialization."""
     project_name = "test-project"
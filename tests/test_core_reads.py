@@ -0,0 +1,101 @@
+"""Tests for the Core read path of generated list endpoints."""
+
+import pytest
+from typer.testing import CliRunner
+
+from fastinit.cli import app
+from fastinit.models.spec import EntitySpec
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def test_project(tmp_path):
+    """Create a test FastAPI project."""
+    project_name = "test-core-reads-project"
+    result = runner.invoke(app, ["init", project_name, "--output", str(tmp_path), "--db"])
+    assert result.exit_code == 0
+    return tmp_path / project_name
+
+
+def test_entity_spec_core_reads():
+    """Test that batch entities opt into Core reads."""
+    assert EntitySpec(name="Event", core_reads=True).core_reads
+    assert not EntitySpec(name="Event").core_reads
+
+
+def test_crud_generates_core_reads(test_project):
+    """Test the row reads, list endpoint and benchmark of a CRUD with Core reads."""
+    result = runner.invoke(
+        app,
+        [
+            "new",
+            "crud",
+            "Event",
+            "--project-dir",
+            str(test_project),
+            "--fields",
+            "title:str,body:text",
+            "--core-reads",
+        ],
+    )
+    assert result.exit_code == 0, result.stdout
+
+    service_content = (test_project / "app" / "services" / "event_service.py").read_text()
+    assert (
+        "ROW_COLUMNS = tuple(Event.__table__.c[name] for name in EventResponse.model_fields)"
+        in service_content
+    )
+    assert "def get_all_rows(" in service_content
+    assert "stmt = select(*EventService.ROW_COLUMNS)" in service_content
+    assert "return [dict(row) for row in result.mappings()]" in service_content
+    compile(service_content, "event_service.py", "exec")
+
+    route_content = (test_project / "app" / "api" / "routes" / "events.py").read_text()
+    assert "items = EventService.get_all_rows(db, skip=skip, limit=limit)" in route_content
+    assert 'return Response(to_json(items), media_type="application/json")' in route_content
+    compile(route_content, "events.py", "exec")
+
+    test_content = (test_project / "tests" / "test_events_rows.py").read_text()
+    assert "tracemalloc.start()" in test_content
+    compile(test_content, "test_events_rows.py", "exec")
+
+
+def test_cached_core_reads_serialize_rows(test_project):
+    """Test that cached lists store the serialized rows."""
+    result = runner.invoke(
+        app,
+        [
+            "new",
+            "crud",
+            "Event",
+            "--project-dir",
+            str(test_project),
+            "--fields",
+            "title:str",
+            "--pagination",
+            "keyset",
+            "--cache",
+            "--core-reads",
+        ],
+    )
+    assert result.exit_code == 0, result.stdout
+
+    service_content = (test_project / "app" / "services" / "event_service.py").read_text()
+    assert "items, next_cursor = EventService.get_all_rows(" in service_content
+    assert "body = to_json(page)" in service_content
+    assert "_PAGE_ADAPTER" not in service_content
+    compile(service_content, "event_service.py", "exec")
+
+
+def test_crud_without_core_reads_has_no_row_reads(test_project):
+    """Test that list endpoints without Core reads are generated as before."""
+    result = runner.invoke(
+        app, ["new", "crud", "Event", "--project-dir", str(test_project), "--fields", "title:str"]
+    )
+    assert result.exit_code == 0
+
+    service_content = (test_project / "app" / "services" / "event_service.py").read_text()
+    assert "get_all_rows" not in service_content
+    assert "to_json" not in (test_project / "app" / "api" / "routes" / "events.py").read_text()
+    assert not (test_project / "tests" / "test_events_rows.py").exists()
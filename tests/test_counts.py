@@ -0,0 +1,136 @@
+"""Tests for the totals reported by generated list endpoints."""
+
+import pytest
+from typer.testing import CliRunner
+
+from fastinit.cli import app
+from fastinit.models.spec import EntitySpec
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def test_project(tmp_path):
+    """Create a test FastAPI project."""
+    project_name = "test-counts-project"
+    result = runner.invoke(app, ["init", project_name, "--output", str(tmp_path), "--db"])
+    assert result.exit_code == 0
+    return tmp_path / project_name
+
+
+def test_entity_spec_count():
+    """Test that batch entities choose a count strategy for their pagination."""
+    assert EntitySpec(name="Event", pagination="keyset", count="estimate").count == "estimate"
+    assert EntitySpec(name="Event").count is None
+    with pytest.raises(ValueError, match="Invalid count strategy"):
+        EntitySpec(name="Event", count="approximate")
+    with pytest.raises(ValueError, match="returns every row"):
+        EntitySpec(name="Event", pagination="none", count="exact")
+
+
+def test_count_settings_are_declared(test_project):
+    """Test that the counter's settings can be set in the environment."""
+    config_content = (test_project / "app" / "core" / "config.py").read_text()
+    assert "COUNT_TTL: int = 60" in config_content
+    assert "COUNT_EXACT_THRESHOLD: int = 100000" in config_content
+
+    env_content = (test_project / ".env.example").read_text()
+    assert "COUNT_TTL=60" in env_content
+    assert "COUNT_EXACT_THRESHOLD=100000" in env_content
+
+
+def test_crud_generates_counted_pages(test_project):
+    """Test the counter, page envelope and test of a keyset CRUD with estimated totals."""
+    result = runner.invoke(
+        app,
+        [
+            "new",
+            "crud",
+            "Event",
+            "--project-dir",
+            str(test_project),
+            "--fields",
+            "kind:enum(a,b):index",
+            "--pagination",
+            "keyset",
+            "--filter",
+            "kind:eq",
+            "--count",
+            "estimate",
+        ],
+    )
+    assert result.exit_code == 0, result.stdout
+
+    service_content = (test_project / "app" / "services" / "event_service.py").read_text()
+    assert 'COUNTER = RowCounter(Event.__table__, "estimate")' in service_content
+    assert "stmt = select(func.count()).select_from(Event)" in service_content
+    assert "signature = filters.model_dump_json(exclude_none=True)" in service_content
+    compile(service_content, "event_service.py", "exec")
+
+    route_content = (test_project / "app" / "api" / "routes" / "events.py").read_text()
+    assert '@router.get("/events", response_model=CountedPage[EventResponse])' in route_content
+    assert "total = EventService.count(db, filters=filters)" in route_content
+    assert '"total_estimated": total.estimated,' in route_content
+    compile(route_content, "events.py", "exec")
+
+    counts_module = (test_project / "app" / "core" / "counts.py").read_text()
+    assert "pg_class" in counts_module
+    assert "settings.COUNT_EXACT_THRESHOLD" in counts_module
+    assert "sqlite_stat1" in counts_module
+    compile(counts_module, "counts.py", "exec")
+
+    test_content = (test_project / "tests" / "test_events_count.py").read_text()
+    assert "assert get_total(client) == (ROWS, True)" in test_content
+    compile(test_content, "test_events_count.py", "exec")
+
+
+def test_crud_reports_list_totals_in_headers(test_project):
+    """Test that lists without an envelope report their total in headers."""
+    result = runner.invoke(
+        app,
+        [
+            "new",
+            "crud",
+            "Event",
+            "--project-dir",
+            str(test_project),
+            "--fields",
+            "title:str",
+            "--cache",
+            "--count",
+            "exact",
+        ],
+    )
+    assert result.exit_code == 0, result.stdout
+
+    route_content = (test_project / "app" / "api" / "routes" / "events.py").read_text()
+    assert "return with_total(cached_response(request, body), total)" in route_content
+    compile(route_content, "events.py", "exec")
+
+    cache_test = (test_project / "tests" / "test_events_cache.py").read_text()
+    assert "def counts_rows(statement: str) -> bool:" in cache_test
+
+
+def test_crud_rejects_counts_without_pages(test_project):
+    """Test that --count is refused for unpaginated lists and unknown strategies."""
+    for options in (["--pagination", "none", "--count", "exact"], ["--count", "approximate"]):
+        result = runner.invoke(
+            app, ["new", "crud", "Event", "--project-dir", str(test_project), *options]
+        )
+        assert result.exit_code == 1
+        assert not (test_project / "app" / "models" / "event.py").exists()
+
+
+def test_crud_without_count_has_no_totals(test_project):
+    """Test that list endpoints without --count are generated as before."""
+    result = runner.invoke(
+        app, ["new", "crud", "Event", "--project-dir", str(test_project), "--fields", "title:str"]
+    )
+    assert result.exit_code == 0
+
+    assert "count" not in (test_project / "app" / "api" / "routes" / "events.py").read_text()
+    assert "COUNTER" not in (
+        test_project / "app" / "services" / "event_service.py"
+    ).read_text()
+    assert not (test_project / "app" / "core" / "counts.py").exists()
+    assert not (test_project / "tests" / "test_events_count.py").exists()
@@ -0,0 +1,272 @@
+"""Tests for the field spec DSL and the columns, indexes and schemas it generates."""
+
+import pytest
+from typer.testing import CliRunner
+
+from fastinit.cli import app
+from fastinit.models.spec import EntitySpec, FieldSpec, parse_fields, parse_index
+
+runner = CliRunner()
+
+PRODUCT_FIELDS = (
+    "name:str(120),sku:str(32):unique,price:decimal(12,2),owner_id:fk(users.id),"
+    "status:enum(draft,active),tags:json,notes:text,released:date:nullable"
+)
+
+
+@pytest.fixture
+def test_project(tmp_path):
+    """Create a test FastAPI project."""
+    project_name = "test-fields-project"
+    result = runner.invoke(app, ["init", project_name, "--output", str(tmp_path), "--db"])
+    assert result.exit_code == 0
+    return tmp_path / project_name
+
+
+def test_parse_fields():
+    """Test parsing types, arguments and modifiers."""
+    fields = parse_fields(
+        "email:str(320):unique:index, price:decimal(12,2), owner_id:fk(users.id):index,"
+        "status:enum(a,b,c), tags:json, name:string, active:boolean"
+    )
+
+    assert list(fields) == ["email", "price", "owner_id", "status", "tags", "name", "active"]
+    assert fields["email"] == FieldSpec("email", "str", length=320, unique=True, index=True)
+    assert fields["price"].column_type == "Numeric(12, 2)"
+    assert fields["price"].python_type == "Decimal"
+    assert fields["price"].constraints == "max_digits=12, decimal_places=2"
+    assert fields["owner_id"].references == "users.id"
+    assert fields["owner_id"].sqlalchemy_types == ["Integer", "ForeignKey"]
+    assert fields["status"].choices == ("a", "b", "c")
+    assert fields["status"].python_type == 'Literal["a", "b", "c"]'
+    assert fields["tags"].column_type == "JSON"
+    # Aliases map to one type
+    assert fields["name"].type == "str"
+    assert fields["name"].column_type == "String(255)"
+    assert fields["active"].type == "bool"
+
+
+def test_field_defaults():
+    """Test nullability and the implicit index on foreign keys."""
+    fields = parse_fields("notes:text,title:str,deleted_at:datetime:nullable,owner_id:fk(users.id)")
+
+    assert fields["notes"].nullable
+    assert not fields["title"].nullable
+    assert fields["deleted_at"].nullable
+    assert fields["owner_id"].indexed
+    assert not fields["title"].indexed
+    assert parse_fields("price:decimal")["price"].column_type == "Numeric(10, 2)"
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("name", "expected 'name:type'"),
+        ("name:varchar", "Invalid type 'varchar'"),
+        ("name:str(0)", "Invalid size"),
+        ("name:str(abc)", "Invalid size"),
+        ("price:decimal(2,4)", "scale larger than its precision"),
+        ("price:decimal(12)", "decimal\\(precision,scale\\)"),
+        ("status:enum", "enum\\(choice,choice,...\\)"),
+        ("status:enum(a,a)", "more than once"),
+        ("status:enum(a b)", "Invalid choice"),
+        ("owner_id:fk(users)", "fk\\(table.column\\)"),
+        ("count:int(4)", "takes no arguments"),
+        ("name:str:primary", "Invalid modifier 'primary'"),
+        ("body:text:index", "cannot be indexed"),
+        ("tags:json:unique", "cannot be indexed"),
+        ("id:int", "added to every model"),
+        ("class:str", "Invalid field name"),
+        ("name:str,name:text", "listed more than once"),
+    ],
+)
+def test_invalid_fields(text, message):
+    """Test that invalid field specs are rejected with a clear error."""
+    with pytest.raises(ValueError, match=message):
+        parse_fields(text)
+
+
+def test_parse_index():
+    """Test that index columns must be indexable fields or built-in columns."""
+    fields = parse_fields("owner_id:fk(users.id),name:str,payload:json")
+
+    assert parse_index("owner_id, created_at", fields) == ["owner_id", "created_at"]
+    assert parse_index(["owner_id", "name"], fields) == ["owner_id", "name"]
+    with pytest.raises(ValueError, match="Unknown index column"):
+        parse_index("missing", fields)
+    with pytest.raises(ValueError, match="cannot be indexed"):
+        parse_index("payload", fields)
+    with pytest.raises(ValueError, match="more than once"):
+        parse_index("name,name", fields)
+
+
+def test_entity_spec_parses_fields_and_indexes():
+    """Test that batch entities accept field specs as strings or mappings."""
+    entity = EntitySpec(
+        name="Order",
+        fields={"owner_id": "fk(users.id)", "total": "decimal(12,2)"},
+        indexes=["owner_id,created_at"],
+        unique=[["owner_id", "total"]],
+    )
+
+    assert entity.fields["total"].precision == 12
+    assert entity.indexes == [["owner_id", "created_at"]]
+    assert entity.unique == [["owner_id", "total"]]
+    with pytest.raises(ValueError, match="Unknown index column"):
+        EntitySpec(name="Order", fields="total:decimal", indexes=["owner_id"])
+
+
+def test_model_columns_and_indexes(test_project):
+    """Test the column types, indexes and constraints of a generated model."""
+    result = runner.invoke(
+        app,
+        [
+            "new",
+            "crud",
+            "Product",
+            "--project-dir",
+            str(test_project),
+            "--fields",
+            PRODUCT_FIELDS,
+            "--index",
+            "owner_id,created_at",
+            "--unique",
+            "owner_id,name",
+        ],
+    )
+    assert result.exit_code == 0, result.stdout
+
+    model_content = (test_project / "app" / "models" / "product.py").read_text()
+    assert "name = Column(String(120), nullable=False)" in model_content
+    assert "sku = Column(String(32), nullable=False, unique=True)" in model_content
+    assert "price = Column(Numeric(12, 2), nullable=False)" in model_content
+    assert (
+        'owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)'
+        in model_content
+    )
+    assert 'Column(Enum("draft", "active", native_enum=False), nullable=False)' in model_content
+    assert "tags = Column(JSON, nullable=False)" in model_content
+    assert "notes = Column(Text, nullable=True)" in model_content
+    assert "released = Column(Date, nullable=True)" in model_content
+    assert 'Index("ix_products_owner_id_created_at", "owner_id", "created_at")' in model_content
+    assert (
+        'UniqueConstraint("owner_id", "name", name="uq_products_owner_id_name")' in model_content
+    )
+    # Only the types in use are imported
+    assert "Float" not in model_content
+    compile(model_content, "product.py", "exec")
+
+    schema_content = (test_project / "app" / "schemas" / "product.py").read_text()
+    assert "from decimal import Decimal" in schema_content
+    assert "name: str = Field(max_length=120)" in schema_content
+    assert "price: Decimal = Field(max_digits=12, decimal_places=2)" in schema_content
+    assert 'status: Literal["draft", "active"]' in schema_content
+    assert "tags: Any" in schema_content
+    assert "released: Optional[date] = None" in schema_content
+    assert "sku: Optional[str] = Field(None, max_length=32)" in schema_content
+    compile(schema_content, "product.py", "exec")
+
+    service_content = (test_project / "app" / "services" / "product_service.py").read_text()
+    assert "def get_by_sku(db: Session, sku: str) -> Optional[Product]:" in service_content
+    assert "select(Product).options(*ProductService.LOAD_OPTIONS)" in service_content
+    assert "where(Product.sku == sku)" in service_content
+    assert "get_by_name" not in service_content
+
+
+def test_plain_fields_keep_their_columns(test_project):
+    """Test that the original field types generate the same columns as before."""
+    result = runner.invoke(
+        app,
+        [
+            "new",
+            "model",
+            "Item",
+            "--project-dir",
+            str(test_project),
+            "--fields",
+            "name:str,count:int,price:float,active:bool,seen_at:datetime",
+        ],
+    )
+    assert result.exit_code == 0
+
+    model_content = (test_project / "app" / "models" / "item.py").read_text()
+    imports = "from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String"
+    assert imports in model_content
+    assert "name = Column(String(255), nullable=False)" in model_content
+    assert "active = Column(Boolean, nullable=False, default=False)" in model_content
+    assert (
+        "seen_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())"
+        in model_content
+    )
+    assert "__table_args__" not in model_content
+
+
+def test_keyset_index_is_not_duplicated(test_project):
+    """Test that a composite index matching the keyset index is generated once."""
+    result = runner.invoke(
+        app,
+        [
+            "new",
+            "crud",
+            "Event",
+            "--project-dir",
+            str(test_project),
+            "--fields",
+            "title:str",
+            "--pagination",
+            "keyset",
+            "--sort",
+            "-created_at",
+            "--index",
+            "created_at,id",
+        ],
+    )
+    assert result.exit_code == 0
+
+    model_content = (test_project / "app" / "models" / "event.py").read_text()
+    assert model_content.count("Index(") == 1
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        ["--fields", "name:varchar"],
+        ["--fields", "name:str", "--index", "missing"],
+        ["--fields", "payload:json", "--pagination", "keyset", "--sort", "payload"],
+    ],
+)
+def test_invalid_fields_generate_nothing(test_project, options):
+    """Test that an invalid spec is rejected before any file is written."""
+    result = runner.invoke(
+        app, ["new", "crud", "Widget", "--project-dir", str(test_project), *options]
+    )
+    assert result.exit_code == 1
+    assert not (test_project / "app" / "models" / "widget.py").exists()
+
+
+def test_sample_values_fit_the_column(test_project):
+    """Test that generated test payloads respect decimal scale and string length."""
+    from fastinit.generators.component import _updated_value
+
+    fields = parse_fields("code:str(4),name:str,count:int,score:float")
+    assert _updated_value(fields["code"], "id") == 'f"updated-{id}"[-4:]'
+    assert _updated_value(fields["name"], "id") == 'f"updated-{id}"'
+    assert _updated_value(fields["count"], "id") == "-id"
+    assert _updated_value(fields["score"], "id") == "id + 0.25"
+
+    # Create payloads are built from the constraints of the generated schema
+    result = runner.invoke(
+        app,
+        [
+            "new", "crud", "Widget", "--project-dir", str(test_project),
+            "--fields", "price:decimal(12,2),code:str(4),kind:enum(x,y)", "--bulk",
+        ],
+    )
+    assert result.exit_code == 0, result.stdout
+    schema_content = (test_project / "app" / "schemas" / "widget.py").read_text()
+    assert "decimal_places=2" in schema_content
+    assert "max_length=4" in schema_content
+    conftest = (test_project / "tests" / "conftest.py").read_text()
+    assert 'return i + 0.5 if _constraint(field, "decimal_places") else i' in conftest
+    assert 'max_length = _constraint(field, "max_length")' in conftest
+    assert "return get_args(annotation)[0]" in conftest
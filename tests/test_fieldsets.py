@@ -0,0 +1,80 @@
+"""Tests for sparse fieldsets (``?fields=``) on generated GET endpoints."""
+
+import pytest
+from typer.testing import CliRunner
+
+from fastinit.cli import app
+from fastinit.models.spec import EntitySpec
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def test_project(tmp_path):
+    """Create a test FastAPI project."""
+    project_name = "test-fieldsets-project"
+    result = runner.invoke(app, ["init", project_name, "--output", str(tmp_path), "--db"])
+    assert result.exit_code == 0
+    return tmp_path / project_name
+
+
+def test_entity_spec_sparse():
+    """Test that batch entities opt into sparse fieldsets."""
+    assert EntitySpec(name="Article", sparse=True).sparse
+    assert not EntitySpec(name="Article").sparse
+
+
+def test_crud_generates_sparse_fieldsets(test_project):
+    """Test the column loading, endpoints, shared module and test of a sparse CRUD."""
+    result = runner.invoke(
+        app,
+        [
+            "new",
+            "crud",
+            "Article",
+            "--project-dir",
+            str(test_project),
+            "--fields",
+            "title:str,body:text",
+            "--sparse",
+            "--cache",
+        ],
+    )
+    assert result.exit_code == 0, result.stdout
+
+    service_content = (test_project / "app" / "services" / "article_service.py").read_text()
+    assert "from sqlalchemy.orm import Session, load_only" in service_content
+    assert "def column_options(fields: Optional[FieldSet]) -> tuple:" in service_content
+    assert "stmt = stmt.options(*ArticleService.column_options(fields))" in service_content
+    assert "body = dump_fieldset(ArticleResponse, fields, items, List)" in service_content
+    compile(service_content, "article_service.py", "exec")
+
+    route_content = (test_project / "app" / "api" / "routes" / "articles.py").read_text()
+    assert (
+        "fields: Optional[FieldSet] = Depends(fieldset_param(ArticleResponse))," in route_content
+    )
+    assert "ArticleService.get_by_id_cached(db, id, fields=fields)" in route_content
+    compile(route_content, "articles.py", "exec")
+
+    fieldsets_module = (test_project / "app" / "core" / "fieldsets.py").read_text()
+    assert "@lru_cache(maxsize=MAX_CACHED_FIELDSETS)" in fieldsets_module
+    compile(fieldsets_module, "fieldsets.py", "exec")
+
+    test_content = (test_project / "tests" / "test_articles_fields.py").read_text()
+    assert 'FIELD = "title"' in test_content
+    compile(test_content, "test_articles_fields.py", "exec")
+
+
+def test_crud_without_sparse_has_no_fieldset_code(test_project):
+    """Test that GET endpoints without sparse fieldsets are generated as before."""
+    result = runner.invoke(
+        app, ["new", "crud", "Article", "--project-dir", str(test_project), "--fields", "title:str"]
+    )
+    assert result.exit_code == 0
+
+    assert "fields" not in (test_project / "app" / "api" / "routes" / "articles.py").read_text()
+    assert "load_only" not in (
+        test_project / "app" / "services" / "article_service.py"
+    ).read_text()
+    assert not (test_project / "app" / "core" / "fieldsets.py").exists()
+    assert not (test_project / "tests" / "test_articles_fields.py").exists()
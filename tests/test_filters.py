@@ -0,0 +1,190 @@
+"""Tests for the whitelisted list filters and sort keys of generated endpoints."""
+
+import pytest
+from typer.testing import CliRunner
+
+from fastinit.cli import app
+from fastinit.models.spec import (
+    EntitySpec,
+    indexed_columns,
+    parse_fields,
+    parse_filters,
+    parse_sortable,
+)
+
+runner = CliRunner()
+
+FIELDS = parse_fields(
+    "name:str(120):index,sku:str(32):unique,price:float:index,owner_id:fk(users.id),"
+    "status:enum(draft,active):index,notes:text,rating:int"
+)
+
+
+@pytest.fixture
+def test_project(tmp_path):
+    """Create a test FastAPI project."""
+    project_name = "test-filters-project"
+    result = runner.invoke(app, ["init", project_name, "--output", str(tmp_path), "--db"])
+    assert result.exit_code == 0
+    return tmp_path / project_name
+
+
+def test_indexed_columns():
+    """Test that indexed, unique and foreign key columns and index prefixes are indexed."""
+    indexed = indexed_columns(FIELDS, ["created_at", "id"], [["rating", "owner_id"]])
+
+    assert indexed == ["id", "name", "sku", "price", "owner_id", "status", "created_at", "rating"]
+    assert "notes" not in indexed
+
+
+def test_parse_filters():
+    """Test parsing columns with their operators, defaulting to equality."""
+    indexed = indexed_columns(FIELDS)
+
+    filters = parse_filters("name:eq:prefix, price:range,status:in:eq,sku,id:in", FIELDS, indexed)
+    assert filters == {
+        "name": ["eq", "prefix"],
+        "price": ["range"],
+        "status": ["in", "eq"],
+        "sku": ["eq"],
+        "id": ["in"],
+    }
+    assert parse_filters({"price": "range", "owner_id": ["eq", "in"]}, FIELDS, indexed) == {
+        "price": ["range"],
+        "owner_id": ["eq", "in"],
+    }
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("missing", "Unknown filter column 'missing'"),
+        ("name:like", "Invalid filter 'like'"),
+        ("price:prefix", "does not apply to 'price'"),
+        ("status:range", "does not apply to 'status'"),
+        ("rating:eq", "'rating' is not indexed"),
+        ("created_at:range", "'created_at' is not indexed"),
+    ],
+)
+def test_invalid_filters(text, message):
+    """Test that unknown, mistyped and unindexed filters are rejected."""
+    with pytest.raises(ValueError, match=message):
+        parse_filters(text, FIELDS, indexed_columns(FIELDS))
+
+
+def test_parse_sortable():
+    """Test that only indexed columns may be sorted by."""
+    indexed = indexed_columns(FIELDS, indexes=[["rating", "owner_id"]])
+
+    assert parse_sortable("price, rating,price", FIELDS, indexed) == ["price", "rating"]
+    with pytest.raises(ValueError, match="'notes' is not indexed"):
+        parse_sortable("notes", FIELDS, indexed)
+    with pytest.raises(ValueError, match="Unknown sort column"):
+        parse_sortable("missing", FIELDS, indexed)
+
+
+def test_entity_spec_validates_filters():
+    """Test that batch entities check filters against their own indexes."""
+    entity = EntitySpec(
+        name="Order",
+        fields="total:float,placed_at:datetime",
+        indexes=["placed_at,total"],
+        filters={"placed_at": "range"},
+        sortable="placed_at",
+    )
+    assert entity.filters == {"placed_at": ["range"]}
+    assert entity.sortable == ["placed_at"]
+
+    with pytest.raises(ValueError, match="'total' is not indexed"):
+        EntitySpec(name="Order", fields="total:float", filters="total:range")
+    with pytest.raises(ValueError, match="fixes the order"):
+        EntitySpec(
+            name="Order", fields="total:float:index", pagination="cursor", sortable="total"
+        )
+
+
+def test_crud_generates_filters(test_project):
+    """Test the filter schema, service clauses, endpoint and test of a filtered CRUD."""
+    result = runner.invoke(
+        app,
+        [
+            "new",
+            "crud",
+            "Product",
+            "--project-dir",
+            str(test_project),
+            "--fields",
+            "name:str(120):index,price:float:index,status:enum(draft,active):index",
+            "--filter",
+            "name:prefix,price:range,status:eq:in",
+            "--sortable",
+            "price",
+        ],
+    )
+    assert result.exit_code == 0, result.stdout
+
+    schema_content = (test_project / "app" / "schemas" / "product.py").read_text()
+    assert "class ProductFilter(BaseModel):" in schema_content
+    assert "name_prefix: Optional[str] = Field(None, min_length=1, max_length=120)" in (
+        schema_content
+    )
+    assert "price_gte: Optional[float] = None" in schema_content
+    assert "price_lte: Optional[float] = None" in schema_content
+    assert 'status: Optional[Literal["draft", "active"]] = None' in schema_content
+    assert (
+        'status_in: Optional[List[Literal["draft", "active"]]] = Field(None, max_length=100)'
+        in schema_content
+    )
+    assert 'sort: Optional[Literal["price", "-price"]] = None' in schema_content
+    compile(schema_content, "product.py", "exec")
+
+    service_content = (test_project / "app" / "services" / "product_service.py").read_text()
+    assert '"price": Product.price,' in service_content
+    assert "stmt = stmt.where(prefix_filter(Product.name, filters.name_prefix))" in service_content
+    assert "stmt = stmt.where(Product.price >= filters.price_gte)" in service_content
+    assert "stmt = stmt.where(Product.status.in_(filters.status_in))" in service_content
+    assert "stmt = ProductService.apply_filters(stmt, filters)" in service_content
+    compile(service_content, "product_service.py", "exec")
+
+    route_content = (test_project / "app" / "api" / "routes" / "products.py").read_text()
+    assert "filters: ProductFilter = Depends(query_params(ProductFilter))," in route_content
+    assert "ProductService.get_all(db, skip=skip, limit=limit, filters=filters)" in route_content
+
+    filters_module = (test_project / "app" / "core" / "filters.py").read_text()
+    assert "def query_params(" in filters_module
+    assert "def prefix_filter(" in filters_module
+    compile(filters_module, "filters.py", "exec")
+
+    test_content = (test_project / "tests" / "test_products_filters.py").read_text()
+    assert "EXPLAIN QUERY PLAN" in test_content
+    compile(test_content, "test_products_filters.py", "exec")
+
+
+def test_crud_without_filters_has_no_filter_code(test_project):
+    """Test that list endpoints without filters are generated as before."""
+    result = runner.invoke(
+        app, ["new", "crud", "Product", "--project-dir", str(test_project), "--fields", "name:str"]
+    )
+    assert result.exit_code == 0
+
+    assert "Filter" not in (test_project / "app" / "schemas" / "product.py").read_text()
+    assert "filters" not in (test_project / "app" / "services" / "product_service.py").read_text()
+    assert not (test_project / "app" / "core" / "filters.py").exists()
+    assert not (test_project / "tests" / "test_products_filters.py").exists()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        ["--fields", "name:str", "--filter", "name:prefix"],
+        ["--fields", "name:str", "--sortable", "name"],
+        ["--fields", "name:str:index", "--sortable", "name", "--pagination", "keyset"],
+    ],
+)
+def test_unindexed_filters_generate_nothing(test_project, options):
+    """Test that filters and sort keys a list query could not serve from an index are refused."""
+    result = runner.invoke(
+        app, ["new", "crud", "Widget", "--project-dir", str(test_project), *options]
+    )
+    assert result.exit_code == 1
+    assert not (test_project / "app" / "models" / "widget.py").exists()
@@ -1,5 +1,10 @@
 """Tests for generated project functionality."""
 
+import json
+import subprocess
+import sys
+
+import pytest
 from typer.testing import CliRunner
 
 from fastinit.cli import app
@@ -35,6 +40,9 @@ def test_generated_project_structure(tmp_path):
     assert (project_dir / "pyproject.toml").is_file()
     assert (project_dir / ".env.example").is_file()
 
+    # Streaming responses need the session kept open after the route returns (FastAPI 0.118+)
+    assert '"fastapi[standard]>=0.118.0"' in (project_dir / "pyproject.toml").read_text()
+
 
 def test_generated_project_imports(tmp_path):
     """Test that generated project has valid Python imports."""
@@ -210,6 +218,442 @@ def test_database_types(tmp_path):
             assert "mysql" in content.lower()
 
 
+def test_async_db_driver(tmp_path):
+    """Test that --db-driver async generates an asyncio SQLAlchemy stack."""
+    project_name = "test-async-db"
+    result = runner.invoke(
+        app,
+        [
+            "init",
+            project_name,
+            "--output",
+            str(tmp_path),
+            "--db",
+            "--db-type",
+            "sqlite",
+            "--db-driver",
+            "async",
+        ],
+    )
+    assert result.exit_code == 0
+
+    project_dir = tmp_path / project_name
+    session_content = (project_dir / "app" / "db" / "session.py").read_text()
+    assert "create_async_engine" in session_content
+    assert "async_sessionmaker" in session_content
+
+    deps_content = (project_dir / "app" / "api" / "deps.py").read_text()
+    assert "async def get_db" in deps_content
+
+    assert "sqlite+aiosqlite://" in (project_dir / ".env.example").read_text()
+    assert "aiosqlite" in (project_dir / "pyproject.toml").read_text()
+    assert "async_engine_from_config" in (project_dir / "alembic" / "env.py").read_text()
+
+    result = runner.invoke(
+        app, ["new", "crud", "Product", "--fields", "name:str", "--project-dir", str(project_dir)]
+    )
+    assert result.exit_code == 0
+
+    service_content = (project_dir / "app" / "services" / "product_service.py").read_text()
+    assert "async def get_all(db: AsyncSession" in service_content
+    assert "await db.commit()" in service_content
+
+    route_content = (project_dir / "app" / "api" / "routes" / "products.py").read_text()
+    assert "db: AsyncSession = Depends(get_db)" in route_content
+    assert "await ProductService.get_by_id" in route_content
+
+
+def test_invalid_db_driver(tmp_path):
+    """Test that unknown database drivers are rejected."""
+    result = runner.invoke(
+        app,
+        ["init", "test-bad-driver", "--output", str(tmp_path), "--db", "--db-driver", "gevent"],
+    )
+    assert result.exit_code == 1
+    assert not (tmp_path / "test-bad-driver").exists()
+
+
+def test_pool_settings(tmp_path):
+    """Test that pool tuning is exposed in Settings and wired into the engine."""
+    project_name = "test-pool"
+    result = runner.invoke(
+        app, ["init", project_name, "--output", str(tmp_path), "--db", "--db-type", "mysql"]
+    )
+    assert result.exit_code == 0
+
+    project_dir = tmp_path / project_name
+    config_content = (project_dir / "app" / "core" / "config.py").read_text()
+    for name in [
+        "DB_POOL_SIZE",
+        "DB_MAX_OVERFLOW",
+        "DB_POOL_TIMEOUT",
+        "DB_POOL_RECYCLE",
+        "DB_POOL_PRE_PING",
+        "DB_STATEMENT_TIMEOUT_MS",
+    ]:
+        assert name in config_content
+    assert "DB_POOL_RECYCLE: int = 3600" in config_content
+    assert "DB_POOL_PRE_PING: bool = True" in config_content
+
+    session_content = (project_dir / "app" / "db" / "session.py").read_text()
+    assert '"pool_size": settings.DB_POOL_SIZE' in session_content
+    assert "PRAGMA journal_mode=WAL" in session_content
+
+    health_content = (project_dir / "app" / "api" / "routes" / "health.py").read_text()
+    assert '@router.get("/health/db/pool")' in health_content
+
+
+def test_service_single_statement_writes(tmp_path):
+    """Test that services read by primary key and write without extra round trips."""
+    for db_type in ["postgresql", "mysql"]:
+        project_name = f"test-service-{db_type}"
+        result = runner.invoke(
+            app, ["init", project_name, "--output", str(tmp_path), "--db", "--db-type", db_type]
+        )
+        assert result.exit_code == 0
+
+        project_dir = tmp_path / project_name
+        result = runner.invoke(
+            app,
+            ["new", "crud", "Product", "--project-dir", str(project_dir), "--fields", "name:str"],
+        )
+        assert result.exit_code == 0
+
+        service_content = (project_dir / "app" / "services" / "product_service.py").read_text()
+        assert "db.get(Product, id, options=ProductService.LOAD_OPTIONS)" in service_content
+        assert "LOAD_OPTIONS = ()" in service_content
+        assert "db.execute(delete(Product).where(Product.id == id))" in service_content
+        assert "return result.rowcount > 0" in service_content
+
+        if db_type == "mysql":
+            assert ".returning(" not in service_content
+            assert "obj = db.get(Product, id)" in service_content
+        else:
+            assert ".returning(Product)" in service_content
+            assert "db.refresh(" not in service_content
+            assert "select(Product).filter(Product.id == id)" not in service_content
+
+
+def test_service_eager_loading(tmp_path):
+    """Test that --eager declares loader options used by every read."""
+    project_name = "test-eager"
+    result = runner.invoke(
+        app, ["init", project_name, "--output", str(tmp_path), "--db", "--db-driver", "async"]
+    )
+    assert result.exit_code == 0
+
+    project_dir = tmp_path / project_name
+    result = runner.invoke(
+        app,
+        [
+            "new",
+            "crud",
+            "Order",
+            "--project-dir",
+            str(project_dir),
+            "--eager",
+            "lines,customer:joined",
+        ],
+    )
+    assert result.exit_code == 0
+
+    service_content = (project_dir / "app" / "services" / "order_service.py").read_text()
+    assert "from sqlalchemy.orm import joinedload, selectinload" in service_content
+    assert "selectinload(Order.lines)," in service_content
+    assert "joinedload(Order.customer)," in service_content
+    # Joined collections need de-duplicating
+    assert "result.scalars().unique().all()" in service_content
+
+    result = runner.invoke(
+        app,
+        ["new", "crud", "Invoice", "--project-dir", str(project_dir), "--eager", "lines:lazy"],
+    )
+    assert result.exit_code == 1
+    assert "Invalid loader" in result.stdout
+
+
+# A Product with every field type, owned by a User, indexed for the filter tests
+PRODUCT_FIELDS = (
+    "name:str(120):index,sku:str(12):unique,price:decimal(12,2):index,"
+    "status:enum(draft,active):index,released:date:index,in_stock:bool:index,"
+    "owner_id:fk(users.id),tags:json,notes:text"
+)
+
+
+def _generate_crud_project(tmp_path, crud_options, init_options=()):
+    """Create a project with a User model and a Product CRUD generated with ``crud_options``."""
+    project_name = "test-crud"
+    result = runner.invoke(
+        app, ["init", project_name, "--output", str(tmp_path), "--db", *init_options]
+    )
+    assert result.exit_code == 0
+
+    project_dir = tmp_path / project_name
+    result = runner.invoke(
+        app,
+        [
+            "new", "model", "User", "--project-dir", str(project_dir),
+            "--fields", "email:str(320):unique:index",
+        ],
+    )
+    assert result.exit_code == 0
+    result = runner.invoke(
+        app,
+        [
+            "new", "crud", "Product", "--project-dir", str(project_dir),
+            "--fields", PRODUCT_FIELDS, *crud_options,
+        ],
+    )
+    assert result.exit_code == 0, result.stdout
+    return project_dir
+
+
+def _run_generated_tests(project_dir, path: str = "tests") -> str:
+    """Run the tests of a generated project, check they pass and return their output."""
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", path],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert " failed" not in result.stdout
+    return result.stdout
+
+
+def test_bulk_crud_generation(tmp_path):
+    """Test that --bulk adds chunked bulk endpoints and a test for them."""
+    project_dir = _generate_crud_project(tmp_path, ["--bulk"])
+
+    service_content = (project_dir / "app" / "services" / "product_service.py").read_text()
+    assert "BULK_CHUNK_SIZE = 1000" in service_content
+    assert "db.execute(insert(Product), items[start:start + chunk_size])" in service_content
+    assert "db.execute(update(Product), items[start:start + chunk_size])" in service_content
+    assert "delete(Product).where(Product.id.in_(chunk))" in service_content
+    # One commit per bulk call, not per row
+    assert service_content.count("db.commit()") == 6
+
+    route_content = (project_dir / "app" / "api" / "routes" / "products.py").read_text()
+    assert route_content.index('"/products/bulk"') < route_content.index('"/products/{id}"')
+    assert "@router.patch(\"/products/bulk\"" in route_content
+    assert "@router.delete(\"/products/bulk\"" in route_content
+
+    schema_content = (project_dir / "app" / "schemas" / "product.py").read_text()
+    assert "class ProductBulkUpdate(ProductUpdate):" in schema_content
+
+    conftest = (project_dir / "tests" / "conftest.py").read_text()
+    assert "def make_client(engine)" in conftest
+    assert "def make_payload()" in conftest
+    # Tests use the app's session semantics (see db/session.py)
+    assert "sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)" in conftest
+    test_content = (project_dir / "tests" / "test_products_bulk.py").read_text()
+    assert "make_client(router)" in test_content
+    assert "ROWS = 3000" in test_content
+    # The foreign key's table is registered for create_all
+    assert "import models.user" in test_content
+
+    # Regenerating refuses to overwrite the test
+    result = runner.invoke(
+        app, ["new", "crud", "Product", "--project-dir", str(project_dir), "--bulk"]
+    )
+    assert result.exit_code == 1
+    assert "tests/test_products_bulk.py" in result.stdout
+
+
+def test_cache_crud_generation(tmp_path):
+    """Test that --cache adds cached reads, invalidation and ETag responses."""
+    project_dir = _generate_crud_project(tmp_path, ["--cache"], ["--cache"])
+
+    config_content = (project_dir / "app" / "core" / "config.py").read_text()
+    for setting in ["CACHE_BACKEND", "CACHE_URL", "CACHE_TTL", "CACHE_MAX_ENTRIES"]:
+        assert setting in config_content
+    assert "redis>=" in (project_dir / "pyproject.toml").read_text()
+
+    cache_content = (project_dir / "app" / "core" / "cache.py").read_text()
+    assert "class MemoryBackend" in cache_content
+    assert "class RedisBackend" in cache_content
+    assert "def cached_response" in cache_content
+
+    service_content = (project_dir / "app" / "services" / "product_service.py").read_text()
+    assert 'CACHE = CacheNamespace("products")' in service_content
+    assert "def get_all_cached" in service_content
+    assert "def get_by_id_cached" in service_content
+    # create, update and delete each invalidate the entity's cached reads
+    assert service_content.count("ProductService.CACHE.invalidate()") == 3
+
+    route_content = (project_dir / "app" / "api" / "routes" / "products.py").read_text()
+    assert route_content.count("return cached_response(request, body)") == 2
+
+    assert (project_dir / "tests" / "test_products_cache.py").is_file()
+
+
+def test_crud_cache_without_init_cache(tmp_path):
+    """`new crud --cache` adds the cache module to projects created without it."""
+    project_name = "test-late-cache"
+    result = runner.invoke(app, ["init", project_name, "--output", str(tmp_path), "--db"])
+    assert result.exit_code == 0
+
+    project_dir = tmp_path / project_name
+    assert not (project_dir / "app" / "core" / "cache.py").exists()
+    result = runner.invoke(
+        app, ["new", "crud", "Country", "--project-dir", str(project_dir), "--cache"]
+    )
+    assert result.exit_code == 0
+    cache_content = (project_dir / "app" / "core" / "cache.py").read_text()
+    assert "settings.CACHE_TTL" in cache_content
+    assert "getattr(settings" not in cache_content
+
+    # The settings are declared, so they can be set in .env
+    config_content = (project_dir / "app" / "core" / "config.py").read_text()
+    env_content = (project_dir / ".env.example").read_text()
+    for setting in ["CACHE_BACKEND", "CACHE_TTL", "CACHE_MAX_ENTRIES"]:
+        assert f"{setting}:" in config_content
+        assert f"{setting}=" in env_content
+    assert "CACHE_URL:" in config_content
+
+
+@pytest.mark.parametrize("library", ["orjson", "msgspec"])
+def test_json_library_default_response_class(tmp_path, library):
+    """Test that --json makes a faster encoder the app's default response class."""
+    project_name = f"test-{library}"
+    result = runner.invoke(
+        app, ["init", project_name, "--output", str(tmp_path), "--json", library]
+    )
+    assert result.exit_code == 0
+
+    project_dir = tmp_path / project_name
+    main_content = (project_dir / "app" / "main.py").read_text()
+    assert "from core.responses import FastJSONResponse" in main_content
+    assert "default_response_class=FastJSONResponse" in main_content
+    assert f'"{library}>=' in (project_dir / "pyproject.toml").read_text()
+    assert "class FastJSONResponse" in (project_dir / "app" / "core" / "responses.py").read_text()
+
+    # The JSON benchmark times the default response class against stdlib JSONResponse
+    result = runner.invoke(
+        app,
+        ["new", "crud", "Product", "--project-dir", str(project_dir), "--dump-json"],
+    )
+    assert result.exit_code == 0, result.stdout
+    benchmark = (project_dir / "tests" / "test_products_json.py").read_text()
+    assert "response_class=FastJSONResponse" in benchmark
+    assert f'"default ({library})": "/default"' in benchmark
+
+
+def test_invalid_json_library(tmp_path):
+    """Test that an unknown --json library is rejected."""
+    result = runner.invoke(app, ["init", "test-json", "--output", str(tmp_path), "--json", "ujson"])
+    assert result.exit_code == 1
+    assert "Invalid JSON library" in result.stdout
+
+
+def test_dump_json_crud_generation(tmp_path):
+    """Test that --dump-json routes serialize straight to bytes and get a benchmark."""
+    project_dir = _generate_crud_project(tmp_path, ["--dump-json"])
+
+    responses_content = (project_dir / "app" / "core" / "responses.py").read_text()
+    assert "def dump_json_response" in responses_content
+    assert "class FastJSONResponse" not in responses_content
+
+    route_content = (project_dir / "app" / "api" / "routes" / "products.py").read_text()
+    assert "_LIST_ADAPTER = TypeAdapter(List[ProductResponse])" in route_content
+    assert "return dump_json_response(_LIST_ADAPTER, items)" in route_content
+    assert route_content.count("dump_json_response(_ITEM_ADAPTER, item") == 3
+    assert "status_code=status.HTTP_201_CREATED)" in route_content
+
+    assert (project_dir / "tests" / "test_products_json.py").is_file()
+
+
+def test_export_crud_generation(tmp_path):
+    """Test that --export adds a streaming NDJSON/CSV endpoint backed by stream_all."""
+    project_dir = _generate_crud_project(tmp_path, ["--export"])
+
+    service_content = (project_dir / "app" / "services" / "product_service.py").read_text()
+    assert "def stream_all(" in service_content
+    assert ".execution_options(yield_per=batch_size)" in service_content
+    assert ".partitions()" in service_content
+
+    route_content = (project_dir / "app" / "api" / "routes" / "products.py").read_text()
+    assert '@router.get("/products/export"' in route_content
+    # The export route must be matched before /products/{id}
+    assert route_content.index('"/products/export"') < route_content.index('"/products/{id}"')
+    assert "csv_chunks(batches, ProductResponse)" in route_content
+
+    export_content = (project_dir / "app" / "core" / "export.py").read_text()
+    assert "def ndjson_chunks" in export_content
+    assert "def csv_chunks" in export_content
+
+    assert (project_dir / "tests" / "test_products_export.py").is_file()
+
+
+@pytest.mark.parametrize("db_driver", ["sync", "async"])
+@pytest.mark.parametrize(
+    "crud_options, init_options",
+    [
+        # Thousands of rows through the bulk endpoints
+        pytest.param(["--bulk"], [], id="bulk"),
+        pytest.param(
+            ["--bulk", "--cache", "--index", "owner_id,created_at", "--unique", "owner_id,name"],
+            [],
+            id="bulk-cache-constraints",
+        ),
+        pytest.param(["--cache"], ["--cache"], id="cache"),
+        # Identical 1,000-item pages, served no slower than by stdlib JSONResponse
+        pytest.param(["--dump-json"], ["--json", "orjson"], id="dump-json"),
+        # 100k SQLite rows streamed in bounded memory
+        pytest.param(["--export"], [], id="export"),
+        # Each filter's query plan
+        pytest.param(
+            [
+                "--filter",
+                "name:eq:prefix,sku:in,price:range,status:eq:in,released:range,in_stock,id:in",
+                "--sortable", "price,name,id",
+                "--cache",
+            ],
+            [],
+            id="filters",
+        ),
+        # The columns each query reads
+        pytest.param(["--sparse", "--pagination", "keyset", "--cache"], [], id="sparse-keyset"),
+        pytest.param(["--sparse"], [], id="sparse"),
+        # Core rows against ORM objects
+        pytest.param(
+            ["--core-reads", "--pagination", "keyset", "--cache", "--sparse"],
+            [],
+            id="core-reads-keyset",
+        ),
+        pytest.param(["--core-reads"], [], id="core-reads"),
+        # Exact, estimated and cached totals on every list endpoint
+        pytest.param(
+            ["--count", "estimate", "--pagination", "keyset", "--cache", "--sparse"],
+            [],
+            id="count-keyset",
+        ),
+        pytest.param(
+            ["--count", "exact", "--filter", "name:eq", "--sortable", "name"],
+            [],
+            id="count-filters",
+        ),
+        pytest.param(
+            ["--count", "estimate", "--pagination", "cursor", "--cache"], [], id="count-cursor"
+        ),
+    ],
+)
+def test_generated_crud_tests_pass(tmp_path, db_driver, crud_options, init_options):
+    """Run the tests generated for CRUD features against SQLite."""
+    pytest.importorskip("fastapi")
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("pydantic_settings")
+    if "orjson" in init_options:
+        pytest.importorskip("orjson")
+    if db_driver == "async":
+        pytest.importorskip("aiosqlite")
+
+    project_dir = _generate_crud_project(
+        tmp_path, crud_options, ["--db-type", "sqlite", "--db-driver", db_driver, *init_options]
+    )
+    _run_generated_tests(project_dir)
+
+
 def test_alembic_configuration_generated(tmp_path):
     """Test that Alembic configuration files are generated correctly."""
     project_name = "test-alembic"
@@ -269,6 +713,331 @@ def test_docker_generation(tmp_path):
     assert (project_dir / ".dockerignore").is_file()
 
 
+def test_production_profile_generation(tmp_path):
+    """Test that --profile production generates a tuned server and multi-stage build."""
+    project_name = "test-production"
+    result = runner.invoke(
+        app,
+        [
+            "init", project_name, "--output", str(tmp_path), "--db", "--docker",
+            "--profile", "production",
+        ],
+    )
+    assert result.exit_code == 0
+
+    project_dir = tmp_path / project_name
+    serve_content = (project_dir / "app" / "serve.py").read_text()
+    assert 'loop="uvloop"' in serve_content
+    assert 'http="httptools"' in serve_content
+    assert "workers = worker_count()" in serve_content
+
+    config_content = (project_dir / "app" / "core" / "config.py").read_text()
+    for setting in ["SERVER_WORKERS", "SERVER_BACKLOG", "SERVER_KEEPALIVE_TIMEOUT"]:
+        assert setting in config_content
+    assert 'SERVER_FORWARDED_ALLOW_IPS: str = "127.0.0.1"' in config_content
+
+    dockerfile = (project_dir / "Dockerfile").read_text()
+    assert "AS builder" in dockerfile
+    assert "COPY --from=builder /opt/venv /opt/venv" in dockerfile
+    assert "python -m compileall" in dockerfile
+    # The non-root user creates the SQLite database next to the code
+    assert "COPY --chown=app:app app ./app" in dockerfile
+    assert 'CMD ["python", "serve.py"]' in dockerfile
+    assert "pip install -e" not in dockerfile
+    # The compiler is only installed in the build stage
+    assert dockerfile.index("gcc") < dockerfile.index("COPY --from=builder")
+
+    compose = (project_dir / "docker-compose.yml").read_text()
+    assert "--reload" not in compose
+    assert ".:/app" not in compose
+
+
+def test_development_profile_has_no_server_entry_point(tmp_path):
+    """Test that the default profile keeps the single-process development setup."""
+    project_name = "test-development"
+    result = runner.invoke(app, ["init", project_name, "--output", str(tmp_path), "--docker"])
+    assert result.exit_code == 0
+
+    project_dir = tmp_path / project_name
+    assert not (project_dir / "app" / "serve.py").exists()
+    assert "SERVER_WORKERS" not in (project_dir / "app" / "core" / "config.py").read_text()
+    assert "--reload" in (project_dir / "docker-compose.yml").read_text()
+
+
+def test_invalid_profile(tmp_path):
+    """Test that an unknown --profile is rejected."""
+    result = runner.invoke(
+        app, ["init", "test-profile", "--output", str(tmp_path), "--profile", "staging"]
+    )
+    assert result.exit_code == 1
+    assert "Invalid profile" in result.stdout
+
+
+def test_generated_serve_test_passes(tmp_path):
+    """Run the generated tests of the CPU quota based worker count."""
+    pytest.importorskip("uvicorn")
+    pytest.importorskip("pydantic_settings")
+
+    project_name = "test-serve"
+    result = runner.invoke(
+        app, ["init", project_name, "--output", str(tmp_path), "--profile", "production"]
+    )
+    assert result.exit_code == 0
+
+    assert "5 passed" in _run_generated_tests(tmp_path / project_name)
+
+
+def test_metrics_generation(tmp_path):
+    """Test that --metrics adds the middleware, /metrics and query instrumentation."""
+    project_name = "test-metrics"
+    result = runner.invoke(
+        app, ["init", project_name, "--output", str(tmp_path), "--db", "--metrics"]
+    )
+    assert result.exit_code == 0
+
+    app_dir = tmp_path / project_name / "app"
+    metrics_content = (app_dir / "core" / "metrics.py").read_text()
+    assert "class MetricsMiddleware" in metrics_content
+    assert "def instrument_engine" in metrics_content
+    assert "before_cursor_execute" in metrics_content
+
+    main_content = (app_dir / "main.py").read_text()
+    assert "app.add_middleware(MetricsMiddleware)" in main_content
+    assert 'app.add_route("/metrics", metrics' in main_content
+    assert "instrument_engine(engine)" in (app_dir / "db" / "session.py").read_text()
+    assert (tmp_path / project_name / "tests" / "test_metrics.py").is_file()
+    assert "prometheus-client" in (tmp_path / project_name / "pyproject.toml").read_text()
+
+
+def test_metrics_without_db(tmp_path):
+    """Test that request metrics work without query instrumentation."""
+    project_name = "test-metrics-nodb"
+    result = runner.invoke(app, ["init", project_name, "--output", str(tmp_path), "--metrics"])
+    assert result.exit_code == 0
+
+    metrics_content = (tmp_path / project_name / "app" / "core" / "metrics.py").read_text()
+    assert "class MetricsMiddleware" in metrics_content
+    assert "sqlalchemy" not in metrics_content
+
+
+@pytest.mark.parametrize("db_driver", ["sync", "async"])
+def test_generated_metrics_tests_pass(tmp_path, db_driver):
+    """Run the generated metrics tests, including the middleware overhead benchmark."""
+    pytest.importorskip("fastapi")
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("pydantic_settings")
+    pytest.importorskip("prometheus_client")
+    if db_driver == "async":
+        pytest.importorskip("aiosqlite")
+
+    project_name = f"test-metrics-{db_driver}"
+    result = runner.invoke(
+        app,
+        [
+            "init", project_name, "--output", str(tmp_path), "--db", "--db-type", "sqlite",
+            "--db-driver", db_driver, "--metrics",
+        ],
+    )
+    assert result.exit_code == 0
+
+    assert "3 passed" in _run_generated_tests(tmp_path / project_name, "tests/test_metrics.py")
+
+
+def test_logging_generation(tmp_path):
+    """Test that --logging generates the queued JSON logging setup."""
+    project_name = "test-logging"
+    result = runner.invoke(
+        app, ["init", project_name, "--output", str(tmp_path), "--db", "--logging"]
+    )
+    assert result.exit_code == 0
+
+    app_dir = tmp_path / project_name / "app"
+    logging_content = (app_dir / "core" / "logging.py").read_text()
+    assert "QueueListener(" in logging_content
+    assert "from pythonjsonlogger.json import JsonFormatter" in logging_content
+    assert "class RequestLoggingMiddleware" in logging_content
+
+    main_content = (app_dir / "main.py").read_text()
+    assert "setup_logging()" in main_content
+    assert "basicConfig" not in main_content
+    assert "RequestLoggingMiddleware," in main_content
+
+    health_content = (app_dir / "api" / "routes" / "health.py").read_text()
+    assert 'logger.error("Database health check failed: %s", e)' in health_content
+    assert 'logger.info("Health check requested")' not in health_content
+
+    config_content = (app_dir / "core" / "config.py").read_text()
+    assert "LOG_SAMPLE_RATE: float" in config_content
+    assert "REQUEST_ID_HEADER: str" in config_content
+
+
+@pytest.mark.parametrize("db_driver", ["sync", "async"])
+def test_generated_logging_tests_pass(tmp_path, db_driver):
+    """Run the generated logging tests in a project with a database."""
+    pytest.importorskip("fastapi")
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("pydantic_settings")
+    pytest.importorskip("pythonjsonlogger.json")
+    if db_driver == "async":
+        pytest.importorskip("aiosqlite")
+
+    project_name = f"test-logging-{db_driver}"
+    result = runner.invoke(
+        app,
+        [
+            "init", project_name, "--output", str(tmp_path), "--db", "--db-type", "sqlite",
+            "--db-driver", db_driver, "--logging",
+        ],
+    )
+    assert result.exit_code == 0
+
+    assert "7 passed" in _run_generated_tests(tmp_path / project_name)
+
+    # The app itself imports cleanly with logging and a database
+    result = subprocess.run(
+        [sys.executable, "-c", "import main"],
+        cwd=tmp_path / project_name / "app",
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_profiling_generation(tmp_path):
+    """Test that --profiling adds a settings-gated profiler with SQL capture."""
+    project_name = "test-profiling"
+    result = runner.invoke(
+        app, ["init", project_name, "--output", str(tmp_path), "--db", "--profiling"]
+    )
+    assert result.exit_code == 0
+
+    app_dir = tmp_path / project_name / "app"
+    profiling_content = (app_dir / "core" / "profiling.py").read_text()
+    assert "class ProfilingMiddleware" in profiling_content
+    assert "def capture_queries" in profiling_content
+
+    main_content = (app_dir / "main.py").read_text()
+    # The middleware and SQL hooks are only installed when enabled
+    assert "if settings.PROFILING_ENABLED:\n    capture_queries(engine)" in main_content
+    assert "app.add_middleware(\n        ProfilingMiddleware" in main_content
+
+    config_content = (app_dir / "core" / "config.py").read_text()
+    assert "PROFILING_ENABLED: bool = False" in config_content
+    assert 'PROFILING_TOKEN: str = ""' in config_content
+
+
+@pytest.mark.parametrize("db_driver", ["sync", "async"])
+def test_generated_profiling_tests_pass(tmp_path, db_driver):
+    """Run the generated profiling tests."""
+    pytest.importorskip("fastapi")
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("pydantic_settings")
+    if db_driver == "async":
+        pytest.importorskip("aiosqlite")
+
+    project_name = f"test-profiling-{db_driver}"
+    result = runner.invoke(
+        app,
+        [
+            "init", project_name, "--output", str(tmp_path), "--db", "--db-type", "sqlite",
+            "--db-driver", db_driver, "--profiling",
+        ],
+    )
+    assert result.exit_code == 0
+
+    assert "5 passed" in _run_generated_tests(tmp_path / project_name, "tests/test_profiling.py")
+
+
+# Generous latency budget for the generated load test; in-process requests against
+# SQLite take a few milliseconds, so exceeding this points at a template regression
+BENCH_MAX_P95_MS = 500
+
+
+def test_bench_generation(tmp_path):
+    """Test that --bench generates the in-process load test."""
+    project_name = "test-bench"
+    result = runner.invoke(
+        app, ["init", project_name, "--output", str(tmp_path), "--db", "--bench"]
+    )
+    assert result.exit_code == 0
+
+    project_dir = tmp_path / project_name
+    bench_content = (project_dir / "bench" / "loadtest.py").read_text()
+    assert "httpx.ASGITransport" in bench_content
+    assert "def discover_resources" in bench_content
+    assert "sqlite:///" in bench_content
+    assert "bench/loadtest.py" in (project_dir / "README.md").read_text()
+
+    result = runner.invoke(app, ["init", "test-no-bench", "--output", str(tmp_path)])
+    assert result.exit_code == 0
+    assert not (tmp_path / "test-no-bench" / "bench").exists()
+
+
+@pytest.mark.parametrize("db_driver", ["sync", "async"])
+def test_generated_bench_runs_against_crud(tmp_path, db_driver):
+    """Run the generated load test against a CRUD project and check its results."""
+    pytest.importorskip("fastapi")
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("pydantic_settings")
+    pytest.importorskip("httpx")
+    if db_driver == "async":
+        pytest.importorskip("aiosqlite")
+
+    project_name = f"test-bench-{db_driver}"
+    result = runner.invoke(
+        app,
+        [
+            "init", project_name, "--output", str(tmp_path), "--db", "--db-type", "sqlite",
+            "--db-driver", db_driver, "--bench",
+        ],
+    )
+    assert result.exit_code == 0
+
+    project_dir = tmp_path / project_name
+    result = runner.invoke(
+        app,
+        [
+            "new", "crud", "Product", "--project-dir", str(project_dir),
+            "--fields", "name:str,price:float,in_stock:bool",
+        ],
+    )
+    assert result.exit_code == 0
+
+    command = [
+        sys.executable, "bench/loadtest.py", "--requests", "200", "--concurrency", "8",
+        "--warmup", "10", "--seed", "20",
+    ]
+    result = subprocess.run(
+        [*command, "--output", "first.json"], cwd=project_dir, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    report = json.loads((project_dir / "first.json").read_text())
+    assert set(report["results"]) == {
+        "GET /api/health",
+        "GET /products",
+        "GET /products/{id}",
+        "POST /products",
+        "PUT /products/{id}",
+    }
+    for name, stats in report["results"].items():
+        assert stats["requests"] == 200
+        assert stats["errors"] == 0, name
+        assert stats["rps"] > 0
+        assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+        assert stats["p95_ms"] < BENCH_MAX_P95_MS, f"{name}: p95 {stats['p95_ms']} ms"
+
+    # A second run can be compared against the first
+    result = subprocess.run(
+        [*command, "--output", "second.json", "--compare", "first.json"],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "vs baseline" in result.stdout
+
+
 def test_jwt_configuration(tmp_path):
     """Test JWT configuration in generated project."""
     project_name = "test-jwt-config"
@@ -294,6 +1063,52 @@ def test_jwt_configuration(tmp_path):
     assert "PyJWKClient" in pyproject_content
 
 
+def test_jwks_cache_configuration(tmp_path):
+    """Generated security module caches JWKS keys and verified tokens."""
+    project_name = "test-jwks-cache"
+    result = runner.invoke(app, ["init", project_name, "--output", str(tmp_path), "--jwt"])
+    assert result.exit_code == 0
+
+    project_dir = tmp_path / project_name
+    security = (project_dir / "app" / "core" / "security.py").read_text()
+    assert "class JWKSCache" in security
+    assert "await jwks_cache.get_signing_key(kid)" in security
+    assert "get_signing_key_from_jwt" not in security
+    assert "JWTClaimsError" not in security
+    assert "class TokenCache" in security
+    assert "token_cache.get(token)" in security
+
+    config = (project_dir / "app" / "core" / "config.py").read_text()
+    for setting in [
+        "JWKS_CACHE_TTL",
+        "JWKS_MAX_STALE",
+        "JWKS_NEGATIVE_CACHE_TTL",
+        "JWKS_MIN_REFRESH_INTERVAL",
+        "JWKS_FETCH_TIMEOUT",
+        "TOKEN_CACHE_SIZE",
+    ]:
+        assert setting in config
+        assert setting in (project_dir / ".env.example").read_text()
+
+    assert (project_dir / "tests" / "test_security.py").is_file()
+    assert (project_dir / "tests" / "conftest.py").is_file()
+
+
+def test_generated_security_test_passes(tmp_path):
+    """Run the generated security tests, including the JWKS and token cache benchmarks."""
+    pytest.importorskip("fastapi")
+    pytest.importorskip("pydantic_settings")
+    pytest.importorskip("httpx")
+    pytest.importorskip("cryptography")
+    pytest.importorskip("jwt")
+
+    project_name = "test-jwks-run"
+    result = runner.invoke(app, ["init", project_name, "--output", str(tmp_path), "--jwt"])
+    assert result.exit_code == 0
+
+    assert "6 passed" in _run_generated_tests(tmp_path / project_name)
+
+
 def test_duplicate_file_prevention(tmp_path):
     """Test that generating duplicate files raises an error."""
     project_name = "test-duplicates"
@@ -412,3 +1227,48 @@ def test_schema_generation(tmp_path):
 
     # Check schemas directory has __init__.py
     assert (project_dir / "app" / "schemas" / "__init__.py").is_file()
+
+
+def test_force_replaces_existing_project(tmp_path):
+    """Test that --force swaps in a fresh project without leftovers."""
+    project_name = "test-force"
+    result = runner.invoke(app, ["init", project_name, "--output", str(tmp_path)])
+    assert result.exit_code == 0
+
+    project_dir = tmp_path / project_name
+    (project_dir / "stale.txt").write_text("old")
+
+    result = runner.invoke(app, ["init", project_name, "--output", str(tmp_path), "--force"])
+    assert result.exit_code == 0
+
+    assert (project_dir / "app" / "main.py").is_file()
+    assert not (project_dir / "stale.txt").exists()
+    # No staging or backup directories are left next to the project
+    assert [p.name for p in tmp_path.iterdir()] == [project_name]
+
+
+def test_failed_generation_keeps_existing_project(tmp_path, monkeypatch):
+    """Test that a failed --force run leaves the existing project untouched."""
+    from fastinit.generators.project import ProjectGenerator
+
+    project_name = "test-atomic"
+    result = runner.invoke(app, ["init", project_name, "--output", str(tmp_path)])
+    assert result.exit_code == 0
+
+    project_dir = tmp_path / project_name
+    (project_dir / "keep.txt").write_text("user data")
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(ProjectGenerator, "_swap_into_place", staticmethod(fail))
+
+    result = runner.invoke(
+        app, ["init", project_name, "--output", str(tmp_path), "--force", "--db"]
+    )
+    assert result.exit_code == 1
+    assert "disk full" in result.stdout
+
+    assert (project_dir / "keep.txt").read_text() == "user data"
+    assert not (project_dir / "app" / "db").exists()
+    assert [p.name for p in tmp_path.iterdir()] == [project_name]
@@ -1,9 +1,16 @@
 """Tests for pagination feature in code generation."""
 
+import base64
+import importlib.util
+import json
+from datetime import datetime
+from decimal import Decimal
+
 import pytest
 from typer.testing import CliRunner
 
 from fastinit.cli import app
+from fastinit.models.spec import parse_sort
 
 runner = CliRunner()
 
@@ -267,6 +274,140 @@ def test_crud_with_no_pagination(test_project):
     assert "cursor:" not in route_content
 
 
+def test_crud_with_keyset_pagination(test_project):
+    """Test CRUD generation with keyset pagination on a composite sort."""
+    result = runner.invoke(
+        app,
+        [
+            "new",
+            "crud",
+            "Event",
+            "--project-dir",
+            str(test_project),
+            "--fields",
+            "title:str",
+            "--pagination",
+            "keyset",
+            "--sort",
+            "-created_at",
+        ],
+    )
+    assert result.exit_code == 0
+
+    # Shared helpers are written once
+    pagination_content = (test_project / "app" / "core" / "pagination.py").read_text()
+    assert "class Page(BaseModel, Generic[T]):" in pagination_content
+    assert "def encode_cursor" in pagination_content
+
+    model_content = (test_project / "app" / "models" / "event.py").read_text()
+    assert 'Index("ix_events_created_at_id", "created_at", "id")' in model_content
+
+    service_content = (test_project / "app" / "services" / "event_service.py").read_text()
+    assert "SORT_COLUMNS = (Event.created_at, Event.id)" in service_content
+    assert "keyset_filter(columns, values, descending=True)" in service_content
+    assert "order_by(Event.created_at.desc(), Event.id.desc()).limit(limit + 1)" in service_content
+    assert "offset(" not in service_content
+    assert "count(" not in service_content
+
+    route_content = (test_project / "app" / "api" / "routes" / "events.py").read_text()
+    assert "response_model=Page[EventResponse]" in route_content
+    assert "cursor: Optional[str] = None" in route_content
+    assert '"has_more": next_cursor is not None' in route_content
+
+
+def test_tampered_cursors_are_rejected(test_project):
+    """Test that the generated decode_cursor rejects well-formed cursors of the wrong shape."""
+    result = runner.invoke(
+        app, ["new", "crud", "Event", "--project-dir", str(test_project), "--pagination", "keyset"]
+    )
+    assert result.exit_code == 0
+    path = test_project / "app" / "core" / "pagination.py"
+    spec = importlib.util.spec_from_file_location("generated_pagination", path)
+    pagination = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(pagination)
+
+    values = [datetime(2024, 1, 2, 3, 4, 5), Decimal("1.50"), "a", 7]
+    assert pagination.decode_cursor(pagination.encode_cursor(values), 4) == values
+
+    def encode(values) -> str:
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    for tampered in [
+        encode([{"id": 1}]),
+        encode([{"dt": "2024-01-01", "d": "2024-01-01"}]),
+        encode([{"dt": 1}]),
+        encode([{"dec": "not a number"}]),
+        encode([[1, 2]]),
+        encode({"id": 1}),
+        "not base64!",
+    ]:
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            pagination.decode_cursor(tampered, 1)
+
+
+def test_keyset_pagination_by_id_needs_no_index(test_project):
+    """Test that keyset pagination on the primary key adds no index."""
+    result = runner.invoke(
+        app,
+        ["new", "crud", "Note", "--project-dir", str(test_project), "--pagination", "keyset"],
+    )
+    assert result.exit_code == 0
+
+    model_content = (test_project / "app" / "models" / "note.py").read_text()
+    assert "Index(" not in model_content
+
+    service_content = (test_project / "app" / "services" / "note_service.py").read_text()
+    assert "SORT_COLUMNS = (Note.id,)" in service_content
+
+
+def test_documented_keyset_sort(test_project):
+    """Test the keyset sort given as an example in the CLI help."""
+    assert parse_sort("-created_at,-id") == ["-created_at", "-id"]
+
+    result = runner.invoke(
+        app,
+        [
+            "new",
+            "crud",
+            "Product",
+            "--project-dir",
+            str(test_project),
+            "--pagination",
+            "keyset",
+            "--sort",
+            "-created_at,-id",
+        ],
+    )
+    assert result.exit_code == 0, result.stdout
+
+    service_content = (test_project / "app" / "services" / "product_service.py").read_text()
+    assert "SORT_COLUMNS = (Product.created_at, Product.id)" in service_content
+    assert "keyset_filter(columns, values, descending=True)" in service_content
+
+
+def test_invalid_keyset_sort(test_project):
+    """Test that unknown, nullable or mixed-direction sort columns are rejected."""
+    for sort in ["missing", "content", "-created_at,title"]:
+        result = runner.invoke(
+            app,
+            [
+                "new",
+                "crud",
+                "Article",
+                "--project-dir",
+                str(test_project),
+                "--fields",
+                "title:str,content:text",
+                "--pagination",
+                "keyset",
+                "--sort",
+                sort,
+            ],
+        )
+        assert result.exit_code == 1
+        assert not (test_project / "app" / "models" / "article.py").exists()
+
+
 def test_invalid_pagination_type(test_project):
     """Test that invalid pagination type is rejected."""
     result = runner.invoke(
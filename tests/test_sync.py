@@ -0,0 +1,117 @@
+"""Tests for the project manifest and incremental regeneration."""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from fastinit.cli import app
+from fastinit.generators.sync import ProjectSynchronizer
+from fastinit.models.manifest import MANIFEST_PATH, hash_content, load_manifest
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def test_project(tmp_path):
+    """Create a test FastAPI project."""
+    project_name = "test-sync-project"
+    result = runner.invoke(
+        app, ["init", project_name, "--output", str(tmp_path), "--db", "--jwt"]
+    )
+    assert result.exit_code == 0
+    return tmp_path / project_name
+
+
+def _simulate_old_template(project_dir, path, old_content):
+    """Make a file look like it was generated by an older template."""
+    (project_dir / path).write_text(old_content, encoding="utf-8")
+
+    manifest_file = project_dir / MANIFEST_PATH
+    data = json.loads(manifest_file.read_text())
+    data["files"][path]["inputs"] = "outdated"
+    data["files"][path]["sha256"] = hash_content(old_content)
+    manifest_file.write_text(json.dumps(data))
+
+
+def test_manifest_written_on_init(test_project):
+    """Test that init records config, version and file hashes."""
+    manifest = load_manifest(test_project)
+    assert manifest is not None
+
+    assert manifest.config["project_name"] == "test-sync-project"
+    assert manifest.config["use_db"] is True
+    assert "output_dir" not in manifest.config
+
+    main_record = manifest.files["app/main.py"]
+    assert main_record.template == "main.py.jinja"
+    assert main_record.sha256 == hash_content((test_project / "app" / "main.py").read_text())
+    assert "app/core/security.py" in manifest.files
+
+
+def test_sync_noop_when_nothing_changed(test_project):
+    """Test that syncing an untouched project writes nothing."""
+    manifest_before = (test_project / MANIFEST_PATH).read_text()
+
+    result = runner.invoke(app, ["sync", "--project-dir", str(test_project)])
+    assert result.exit_code == 0
+    assert "up to date" in result.stdout
+    assert (test_project / MANIFEST_PATH).read_text() == manifest_before
+
+
+def test_sync_updates_pristine_files(test_project):
+    """Test that files the user has not edited pick up template changes."""
+    _simulate_old_template(test_project, "app/main.py", "# old main\n")
+
+    result = ProjectSynchronizer(test_project).sync()
+    assert result.updated == ["app/main.py"]
+
+    content = (test_project / "app" / "main.py").read_text()
+    assert "from fastapi import FastAPI" in content
+    assert load_manifest(test_project).files["app/main.py"].sha256 == hash_content(content)
+
+    # A second run is a no-op
+    assert not ProjectSynchronizer(test_project).sync().changed
+
+
+def test_sync_skips_locally_edited_files(test_project):
+    """Test that files edited by the user are never overwritten."""
+    _simulate_old_template(test_project, "app/main.py", "# old main\n")
+    (test_project / "app" / "main.py").write_text("# my own main\n")
+
+    result = runner.invoke(app, ["sync", "--project-dir", str(test_project)])
+    assert result.exit_code == 0
+    assert "edited locally" in result.stdout
+    assert (test_project / "app" / "main.py").read_text() == "# my own main\n"
+
+    # The conflict keeps being reported until resolved
+    assert ProjectSynchronizer(test_project).sync().conflicts == ["app/main.py"]
+
+    # --force overwrites it
+    result = ProjectSynchronizer(test_project).sync(force=True)
+    assert result.updated == ["app/main.py"]
+    assert "from fastapi import FastAPI" in (test_project / "app" / "main.py").read_text()
+
+
+def test_sync_dry_run_and_deleted_files(test_project):
+    """Test dry runs and that deleted files are not recreated."""
+    _simulate_old_template(test_project, "README.md", "old readme\n")
+    _simulate_old_template(test_project, "app/api/deps.py", "old deps\n")
+    (test_project / "app" / "api" / "deps.py").unlink()
+
+    result = runner.invoke(app, ["sync", "--project-dir", str(test_project), "--dry-run"])
+    assert result.exit_code == 0
+    assert "would update" in result.stdout
+    assert (test_project / "README.md").read_text() == "old readme\n"
+
+    result = ProjectSynchronizer(test_project).sync()
+    assert result.updated == ["README.md"]
+    assert result.deleted == ["app/api/deps.py"]
+    assert not (test_project / "app" / "api" / "deps.py").exists()
+
+
+def test_sync_requires_manifest(tmp_path):
+    """Test that projects without a manifest are rejected."""
+    result = runner.invoke(app, ["sync", "--project-dir", str(tmp_path)])
+    assert result.exit_code == 1
+    assert "manifest.json" in result.stdout
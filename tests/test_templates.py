@@ -0,0 +1,72 @@
+"""Tests for template rendering and the compiled template cache."""
+
+import pytest
+
+from fastinit import templates
+from fastinit.templates import TemplateRenderer
+
+
+@pytest.fixture
+def fresh_environment(monkeypatch):
+    """Reset the shared environment before and after a test."""
+    templates.get_environment.cache_clear()
+    yield monkeypatch
+    templates.get_environment.cache_clear()
+
+
+def test_renderers_share_environment(fresh_environment, tmp_path):
+    """Test that all renderers reuse the same compiled templates."""
+    fresh_environment.setenv(templates.CACHE_ENV_VAR, str(tmp_path))
+
+    first = TemplateRenderer()
+    second = TemplateRenderer()
+
+    assert first.env is second.env
+    assert first.env.get_template("main.py.jinja") is second.env.get_template("main.py.jinja")
+
+
+def test_bytecode_cache_written_and_reused(fresh_environment, tmp_path):
+    """Test that compiled templates are stored and loaded from the cache."""
+    fresh_environment.setenv(templates.CACHE_ENV_VAR, str(tmp_path))
+
+    cache_dir = templates.get_cache_dir()
+    assert cache_dir is not None
+    assert cache_dir.parent == tmp_path
+
+    count = templates.precompile_templates()
+    cached_files = list(cache_dir.glob("*.jinjac"))
+    assert count > 0
+    assert len(cached_files) == count
+
+    # A fresh environment must load from bytecode rather than recompile
+    templates.get_environment.cache_clear()
+    env = templates.get_environment()
+
+    def fail_compile(*args, **kwargs):
+        raise AssertionError("template was recompiled despite a warm cache")
+
+    fresh_environment.setattr(env, "compile", fail_compile)
+    content = TemplateRenderer().render("gitignore.jinja", {})
+    assert "__pycache__" in content
+
+
+def test_bytecode_cache_can_be_disabled(fresh_environment):
+    """Test that the cache can be turned off via the environment."""
+    fresh_environment.setenv(templates.CACHE_ENV_VAR, "off")
+
+    assert templates.get_cache_dir() is None
+    assert templates.get_environment().bytecode_cache is None
+
+
+@pytest.mark.parametrize(
+    "db_type, driver", [("postgresql", "asyncpg"), ("mysql", "aiomysql"), ("sqlite", "aiosqlite")]
+)
+def test_requirements_list_async_drivers(db_type, driver):
+    """Test that requirements.txt lists the same async driver as pyproject.toml."""
+    renderer = TemplateRenderer()
+    context = {"use_db": True, "async_db": True, "db_type": db_type}
+
+    requirements = renderer.render("requirements.txt.jinja", context)
+    assert "sqlalchemy[asyncio]>=2.0.0" in requirements
+    assert f"{driver}>=" in requirements
+    assert f'"{driver}>=' in renderer.render("pyproject.toml.jinja", context)